@@ -1,19 +1,35 @@
 """Kelly Waller's Advent of Code solutions."""
 import re  # noqa: F401
 import sys
-import math  # noqa: F401
-import time  # noqa: F401
+import platform
+import math
+import time
 import copy  # noqa: F401
+import functools
+import codecs
+import hashlib
+import os
+import mmap
+import json
+import logging
+import statistics
 import pickle
+import bisect
 import socket
+import tracemalloc
+import threading
+import traceback
+import weakref
 import requests
 import numpy as np
-# import itertools
-import datetime  # noqa: F401
+import itertools
+import datetime
 # import numpy
 from os import path
 import svtools.logging.toolbox as slt
-from collections import OrderedDict
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 # Never did spend the time to work out how to get OAuth to work so this code expects you to
 # manually copy over your session cookie value.
@@ -23,8 +39,29 @@ from collections import OrderedDict
 # Constants
 _CODE_PATH = r"c:\AoC"
 _OFFLINE = False
+_MAPPED_INPUT = False  # True = get_input returns mmap backed MappedLines views instead of tuples
+_FAST = False  # True = solvers skip their per line/item debug tracing whatever the log level
 _YEAR = 2023
+_AOC_URL = "https://adventofcode.com"
+_USER_AGENT = "github.com/Karpellarpy/AoC input fetcher"
+_HTTP_TIMEOUT = 30  # seconds
+_PROXIES = {"http": "proxy-dmz.intel.com:911",
+            "https": "proxy-dmz.intel.com:912"}
+_PROBE_TTL = 300  # seconds a connectivity verdict is trusted for
+_CONNECTIVITY = {"verdict": None, "expires": 0.0}  # memoized _check_internet result
 _NAME = "aoc%d" % _YEAR
+_INPUT_MEMO = {}  # {day: _PuzzleText} in-process layer over the per-day cache shards
+_MARKOV = False  # True = day8 also logs the Markov Chain analysis of a random walk, needs SciPy
+_DIRECT_SOLVE_LIMIT = 2000  # transient day8 nodes above which the Markov analysis solves iteratively
+_DIGIT_NAMES = ("zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+_DIGIT_VALUES = {**{name: digit for digit, name in enumerate(_DIGIT_NAMES)},
+                 **{str(digit): digit for digit in range(10)}}
+# Leftmost digit and (greedy .* backtracking from the end) rightmost digit, spelled or not, overlaps and all
+_FIRST_DIGIT = re.compile("|".join(("[0-9]", *_DIGIT_NAMES)))
+_LAST_DIGIT = re.compile(".*(%s)" % _FIRST_DIGIT.pattern)
+_CUBE_COLORS = ("red", "green", "blue")
+_CUBE_LIMITS = (12, 13, 14)  # day2 bag contents in _CUBE_COLORS order
+_GAME_TOKEN = re.compile(r"Game (\d+)|(\d+) (%s)" % "|".join(_CUBE_COLORS))
 
 _LOG = slt.getLogger(_NAME)
 _LOG.setAutosplit(autosplit=True)
@@ -38,18 +75,172 @@ _LOG.setColor(levelname="DEBUG", color=slt.FG.iwhite)
 # _LOG.setFileLevel("INFO")
 
 
-def _check_internet(host="8.8.8.8", port=53, timeout=2):
-    """Attempt to check for the firewall by connecting to Google's DNS."""
-    ret_code = True
+def _check_internet(host="8.8.8.8", port=53, timeout=2, ttl=_PROBE_TTL):
+    """
+    Attempt to check for the firewall by connecting to Google's DNS.
+
+    The verdict is memoized for ttl seconds so repeated fetches pay for the probe at most once.
+    The probe uses a per-socket timeout (the process wide default is left alone) and always closes its socket.
+    Set the AOC_ONLINE environment variable to 1 or 0 to skip the probe entirely.
+    """
+    env_verdict = os.environ.get("AOC_ONLINE", "").strip().lower()
+    if env_verdict in {"1", "true", "yes"}:
+        return True
+    if env_verdict in {"0", "false", "no"}:
+        return False
+    now = time.monotonic()
+    if _CONNECTIVITY["verdict"] is not None and now < _CONNECTIVITY["expires"]:
+        return _CONNECTIVITY["verdict"]
     try:
-        socket.setdefaulttimeout(timeout)
-        socket.socket(socket.AF_INET, socket.SOCK_STREAM).connect((host, port))
-    except socket.error as ex:  # noqa: UP024, F841
-        # print(ex)
+        with socket.create_connection((host, port), timeout=timeout):
+            ret_code = True
+    except OSError:
         ret_code = False
+    _CONNECTIVITY["verdict"] = ret_code
+    _CONNECTIVITY["expires"] = now + ttl
     return ret_code
 
 
+def _resolve_proxies():
+    """
+    Return the proxies to reach the AOC website with, direct unless behind the firewall.
+
+    The AOC_HTTP_PROXY and AOC_HTTPS_PROXY environment variables replace the default firewall proxies.
+    """
+    # Check to see if behind the firewall.
+    if _check_internet():
+        return {}
+    return {"http": os.environ.get("AOC_HTTP_PROXY", _PROXIES["http"]),
+            "https": os.environ.get("AOC_HTTPS_PROXY", _PROXIES["https"])}
+
+
+def _request_headers():
+    """Return the HTTP headers for an AOC input request, including the session cookie from session.txt."""
+    if not path.exists(_CODE_PATH + "/session.txt"):  # noqa: PTH110
+        err_str = "Using the web browser get the session cookie value\nand put it as a string in {}".format(_CODE_PATH + "\\session.txt")
+        raise RuntimeError(err_str)
+    with open(_CODE_PATH + "/session.txt", "r") as session_file:  # noqa: UP015, PTH123, FURB101
+        session = session_file.read()
+    return {"Cookie": "session={:s}".format(session.rstrip("\n")),
+            "User-Agent": _USER_AGENT}
+
+
+def _puzzle_url(day):
+    """Return the URL of a day's puzzle input."""
+    return f"{_AOC_URL}/{_YEAR}/day/{day}/input"
+
+
+def _fetch_puzzle_chunks(day, chunk_size=1 << 16, validators=None, log=_LOG):
+    """
+    Yield a day's raw puzzle text in chunks from the offline copy or the AOC website response body.
+
+    :param day: (int) the AoC day puzzle input to fetch
+    :param chunk_size: (int) the number of characters/bytes to read at a time
+    :param validators: (dict,None) {"etag": str, "last_modified": str} of the cached copy to make the request
+        conditional on.  Updated in place with the response's validators, or "not_modified": True on a 304.
+    :param log:  logger object
+    :return: generator of str chunks, nothing is yielded if the website returned an error or a 304.
+    """
+    if _OFFLINE:
+        with open(_year_path("day%d.txt" % day)) as file_handler:  # noqa: PTH123
+            yield from iter(lambda: file_handler.read(chunk_size), "")
+        return
+
+    validators = {} if validators is None else validators
+    log.result(slt.FG.icyan("Pulling Data Set"))
+    with requests.Session() as session:
+        session.headers.update(_request_headers())
+        headers = _conditional_headers(validators)
+        with session.get(_puzzle_url(day), headers = headers, proxies = _resolve_proxies(), stream = True, timeout = _HTTP_TIMEOUT) as resp:  # noqa: E251
+            if resp.status_code == 304:
+                log.result("Day %d unchanged since it was cached", day)
+                validators["not_modified"] = True
+                return
+            if not resp.ok:
+                log.warning("Warning website error")
+                return
+            validators["etag"] = resp.headers.get("ETag")
+            validators["last_modified"] = resp.headers.get("Last-Modified")
+            # requests only decodes when the server names a charset, so decode incrementally ourselves
+            decoder = codecs.getincrementaldecoder(resp.encoding or "utf-8")()
+            for raw_chunk in resp.iter_content(chunk_size):
+                yield decoder.decode(raw_chunk)
+            yield decoder.decode(b"", final=True)
+
+
+def _conditional_headers(validators):
+    """Return the If-None-Match/If-Modified-Since headers for a cached copy's validators."""
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _fetch_puzzle_text(day, validators=None, log=_LOG):
+    """
+    Fetch a day's raw puzzle text from the offline copy or the AOC website.
+
+    :param day: (int) the AoC day puzzle input to fetch
+    :param validators: (dict,None) see _fetch_puzzle_chunks
+    :param log:  logger object
+    :return: (str) the raw puzzle text, empty if the website returned an error or a 304.
+    """
+    return "".join(_fetch_puzzle_chunks(day, validators=validators, log=log))
+
+
+def _split_puzzle_stream(chunks, seperator, cast):
+    """
+    Incrementally split chunks of puzzle text, yielding each data element as soon as it's complete.
+
+    Gives the same elements as _split_puzzle_text without ever holding more than one chunk plus a partial element.
+
+    :param chunks: (iterable) str chunks of the raw puzzle text
+    :param seperator: (str,None) A string separator to split on.  If None or "" the whole text is a single element.
+    :param cast: (None,type) A Python function often a type cast (int, str, lambda) to be run against each data element.
+    :return: generator of the data elements.
+    """
+    if seperator in {None, ""}:
+        yield from _split_puzzle_text("".join(chunks), seperator, cast)
+        return
+    sep_len = len(seperator)
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        start = 0
+        end = pending.find(seperator)
+        while end != -1:
+            record = pending[start:end]
+            yield record if cast is None else cast(record)
+            start = end + sep_len
+            end = pending.find(seperator, start)
+        pending = pending[start:]
+    if pending:
+        yield pending if cast is None else cast(pending)
+
+
+def _split_puzzle_text(text, seperator, cast):
+    """
+    Split raw puzzle text into a tuple of data elements.
+
+    :param text: (str) the raw puzzle text
+    :param seperator: (str,None) A string separator to pass into str.split when consuming the puzzle data.
+        If None or "" don't try and split the puzzle input.
+    :param cast: (None,type) A Python function often a type cast (int, str, lambda) to be run against each data element.
+    :return: tuple of the data.
+    """
+    if seperator in {None, ""}:  # noqa: SIM108
+        data_list = [text]
+    else:
+        data_list = text.split(seperator)
+    if data_list[-1] == "":  # noqa: PLC1901
+        data_list.pop(-1)
+    if cast is not None:
+        data_list = [cast(x) for x in data_list]
+    return tuple(data_list)
+
+
 def _pull_puzzle_input(day, seperator, cast, log=_LOG):
     """
     Pull the puzzle data from the AOC website.
@@ -61,73 +252,605 @@ def _pull_puzzle_input(day, seperator, cast, log=_LOG):
     :param log:  logger object
     :return: tuple of the data.
     """
-    if _OFFLINE:
-        with open(_CODE_PATH + rf"\{_YEAR}\day{day}.txt") as file_handler:  # noqa: FURB101, PTH123
-            data_list = file_handler.read().split(seperator)
-    elif type(day) is str:  # An example string
-        data_list = day.split(seperator)
-    else:
-        log.result(slt.FG.icyan("Pulling Data Set"))
-        if not path.exists(_CODE_PATH + "/session.txt"):  # noqa: PTH110
-            err_str = "Using the web browser get the session cookie value\nand put it as a string in {}".format(_CODE_PATH + "\\session.txt")
-            raise RuntimeError(err_str)
-        with open(_CODE_PATH + "/session.txt", "r") as session_file:  # noqa: UP015, PTH123, FURB101
-            session = session_file.read()
-        # Check to see if behind the firewall.
-        if _check_internet():  # noqa: SIM108
-            proxy_dict = {}
+    text = day if type(day) is str else _fetch_puzzle_text(day, log=log)  # An example string or the real data
+    return _split_puzzle_text(text, seperator, cast)
+
+
+def _year_path(*parts):
+    """Return a path inside this year's puzzle directory."""
+    return path.join(_CODE_PATH, str(_YEAR), *parts)
+
+
+def _shard_path(day):
+    """Return the path of the on-disk cache shard holding a single day's raw puzzle text."""
+    return _year_path("input_day%d.txt" % day)
+
+
+def _cast_key(cast):
+    """
+    Return a hashable name for a cast so it can be part of a cache key.
+
+    str is the identity on split puzzle text so it shares the key of None.
+    Functions (and lambdas) include their line number so two lambdas don't collide.
+    """
+    if cast is None or cast is str:
+        return None
+    key = "{}.{}".format(getattr(cast, "__module__", ""), getattr(cast, "__qualname__", repr(cast)))
+    code = getattr(cast, "__code__", None)
+    if code is not None:
+        key += ":%d" % code.co_firstlineno
+    return key
+
+
+class _PuzzleText:
+    """A day's raw puzzle text with the parsed views of it memoized per (seperator, cast)."""
+    def __init__(self, text):
+        """Instantiates an instance of the class."""
+        self.text = text
+        self.views = {}
+
+    def view(self, seperator, cast):
+        """Return the text split on seperator with cast applied, parsing it only the first time it's asked for."""
+        key = (seperator, _cast_key(cast))
+        if key not in self.views:
+            self.views[key] = _split_puzzle_text(self.text, seperator, cast)
+        return self.views[key]
+
+
+class MappedLines:
+    """
+    A lazy, read-only sequence of the records in a day's cache shard backed by mmap.
+
+    Only the byte offset of each record is kept (and only once indexing needs it), records are decoded
+    one at a time as they're asked for so peak memory stays near the size of a single line.
+    Iterating and indexing give the same values a get_input tuple would, slices() gives zero-copy memoryviews.
+    The mapping is released by close(), on leaving a with block, or when the view is garbage collected.
+    """
+    def __init__(self, file_name, seperator, cast):
+        """Instantiates an instance of the class."""
+        self.seperator = (seperator or "").encode()  # None or "" = the whole file is one record
+        self.cast = cast
+        self._file = open(file_name, "rb")  # noqa: SIM115, PTH123
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self._starts = None
+        self._ends = None
+        # Solvers just drop the view, an open mapping would block _save_shard replacing the file on Windows
+        self._finalizer = weakref.finalize(self, self._release, self._file, self._map, self._view)
+
+    @staticmethod
+    def _release(file, file_map, view):
+        """Release the memoryview, the mapping and the file handle (kept off self so the finalizer can run)."""
+        view.release()
+        file_map.close()
+        file.close()
+
+    def _spans(self):
+        """Yield the (start, end) byte offsets of each record, dropping a trailing empty record like str.split."""
+        sep_len = len(self.seperator)
+        map_len = len(self._map)
+        if not sep_len:
+            if map_len:
+                yield 0, map_len
+            return
+        start = 0
+        while start < map_len:
+            end = self._map.find(self.seperator, start)
+            if end == -1:
+                end = map_len
+            yield start, end
+            start = end + sep_len
+
+    def _index(self):
+        """Build the record start offsets the first time random access is needed."""
+        if self._starts is None:
+            self._starts = array("Q")
+            self._ends = array("Q")
+            for start, end in self._spans():
+                self._starts.append(start)
+                self._ends.append(end)
+        return self._starts
+
+    def _record(self, start, end):
+        """Decode and cast a single record."""
+        record = self._map[start:end].decode()
+        return record if self.cast is None else self.cast(record)
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self._index())
+
+    def __getitem__(self, idx):
+        """Return the record(s) at the given index or slice."""
+        starts = self._index()
+        if isinstance(idx, slice):
+            return [self._record(starts[i], self._ends[i]) for i in range(*idx.indices(len(starts)))]
+        return self._record(starts[idx], self._ends[idx])
+
+    def __iter__(self):
+        """Yield each record in order without building the index."""
+        for start, end in self._spans():
+            yield self._record(start, end)
+
+    def slices(self):
+        """Yield a zero-copy memoryview of each record's bytes, valid until close()."""
+        for start, end in self._spans():
+            yield self._view[start:end]
+
+    def close(self):
+        """Release the mapping and the file handle, safe to call more than once."""
+        self._finalizer()
+
+    def __enter__(self):
+        """Support use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close on leaving the context."""
+        self.close()
+
+
+def _meta_path(day):
+    """Return the path of the JSON sidecar holding a day's shard checksum and HTTP validators."""
+    return _year_path("input_day%d.json" % day)
+
+
+def _save_meta(day, digest, size, validators=None):
+    """Write a day's shard checksum, byte size and response validators (ETag/Last-Modified)."""
+    validators = validators or {}
+    meta = {"sha256": digest, "size": size,
+            "etag": validators.get("etag"), "last_modified": validators.get("last_modified")}
+    with open(_meta_path(day) + ".tmp", "w") as meta_file:  # noqa: PTH123
+        json.dump(meta, meta_file)
+    os.replace(_meta_path(day) + ".tmp", _meta_path(day))
+
+
+def _load_meta(day):
+    """Return a day's shard metadata dictionary, empty if it doesn't exist or can't be read."""
+    try:
+        with open(_meta_path(day)) as meta_file:  # noqa: PTH123
+            return json.load(meta_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_shard(day, text, validators=None):
+    """Write a day's raw puzzle text and its metadata, going through a temp file so a crash can't leave a torn shard."""
+    shard_path = _shard_path(day)
+    raw = text.encode("utf-8")
+    with open(shard_path + ".tmp", "wb") as shard_file:  # noqa: PTH123
+        shard_file.write(raw)
+    os.replace(shard_path + ".tmp", shard_path)
+    _save_meta(day, hashlib.sha256(raw).hexdigest(), len(raw), validators)
+
+
+def _shard_status(day):
+    """
+    Check a day's shard against its recorded checksum without touching the network.
+
+    :param day: (int) the AoC day
+    :return: (str) "ok", "missing", "empty", "unverified" (no checksum recorded), "truncated" or "corrupt".
+    """
+    if not path.exists(_shard_path(day)):  # noqa: PTH110
+        return "missing"
+    digest = hashlib.sha256()
+    with open(_shard_path(day), "rb") as shard_file:  # noqa: PTH123
+        for raw_chunk in iter(lambda: shard_file.read(1 << 16), b""):
+            digest.update(raw_chunk)
+        size = shard_file.tell()
+    meta = _load_meta(day)
+    if not size:
+        return "empty"
+    if not meta.get("sha256"):
+        return "unverified"
+    if size < meta.get("size", 0):
+        return "truncated"
+    if size != meta.get("size") or digest.hexdigest() != meta["sha256"]:
+        return "corrupt"
+    return "ok"
+
+
+def _text_digest(text):
+    """Return the sha256 hex digest of puzzle text as it is stored in a shard."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _cached_validators(day):
+    """Return the validators to make a refetch conditional on, only when the cached shard is intact."""
+    if _shard_status(day) != "ok":
+        return {}
+    meta = _load_meta(day)
+    return {"etag": meta.get("etag"), "last_modified": meta.get("last_modified"), "sha256": meta.get("sha256")}
+
+
+def verify_cache(days=range(1, 26), log=_LOG):
+    """
+    Report corrupted or truncated puzzle input cache entries without hitting the network.
+
+    Args:
+        days (iterable): The days of December to check
+        log (slt.EasyLogger, optional): Logger object
+    Returns:
+        dictionary of {day: status} for each day that has a cache entry, see _shard_status for the statuses.
+    """
+    report = {}
+    for day in days:
+        status = _shard_status(day)
+        if status == "missing":
+            continue
+        report[day] = status
+        if status == "ok":
+            log.result("Day %2d: ok", day)
         else:
-            proxy_dict = {"http": "proxy-dmz.intel.com:911",
-                          "https": "proxy-dmz.intel.com:912"}
-        header = {"Cookie": "session={:s}".format(session.rstrip("\n"))}
-        with requests.Session() as session:
-            resp = session.get(f"https://adventofcode.com/{_YEAR}/day/{day}/input", headers = header, proxies = proxy_dict)  # noqa: E251
-            _text = resp.text.strip("\n")
-            if resp.ok:
-                if seperator in {None, ""}:  # noqa: SIM108
-                    data_list = [resp.text]
-                else:
-                    data_list = resp.text.split(seperator)
+            log.warning("Day %2d: %s", day, status)
+        if path.exists(_shard_path(day) + ".tmp"):  # noqa: PTH110
+            log.warning("Day %2d: abandoned partial write %s", day, _shard_path(day) + ".tmp")
+    return report
+
+
+def _read_shard_chunks(day, chunk_size=1 << 16):
+    """Yield a day's cached raw puzzle text in chunks straight from its shard file."""
+    with open(_shard_path(day), encoding="utf-8", newline="") as shard_file:  # noqa: PTH123
+        yield from iter(lambda: shard_file.read(chunk_size), "")
+
+
+def _tee_to_shard(day, chunks, validators=None):
+    """
+    Pass chunks of freshly fetched puzzle text through while writing them to the day's shard.
+
+    The shard is only replaced once every chunk has been seen so an abandoned stream can't leave a truncated cache.
+    """
+    shard_path = _shard_path(day)
+    digest = hashlib.sha256()
+    size = 0
+    complete = False
+    try:
+        with open(shard_path + ".tmp", "wb") as shard_file:  # noqa: PTH123
+            for chunk in chunks:
+                raw_chunk = chunk.encode("utf-8")
+                shard_file.write(raw_chunk)
+                digest.update(raw_chunk)
+                size += len(raw_chunk)
+                yield chunk
+            complete = size > 0
+    finally:
+        if complete:
+            os.replace(shard_path + ".tmp", shard_path)
+            _save_meta(day, digest.hexdigest(), size, validators)
+        elif path.exists(shard_path + ".tmp"):  # noqa: PTH110
+            os.remove(shard_path + ".tmp")  # noqa: PTH107
+
+
+def _migrate_legacy_pickle(log=_LOG):
+    """
+    Split the monolithic input.p pickle cache earlier versions wrote into per-day text shards.
+
+    input.p held split tuples rather than text.  Every solver asked for "\n" separated strings, so a tuple made
+    entirely of strings is joined back into text; anything else can't be attributed and is refetched.  The pickle
+    is renamed afterwards so it's only ever read one time.
+
+    :param log:  logger object
+    """
+    legacy_path = _year_path("input.p")
+    if not path.exists(legacy_path):  # noqa: PTH110
+        return
+    with open(legacy_path, "rb") as legacy_file:  # noqa: PTH123
+        puzzle_dict = pickle.load(legacy_file)  # noqa: S301
+    for legacy_day, puzzle_input in puzzle_dict.items():
+        if type(legacy_day) is int and puzzle_input and not path.exists(_shard_path(legacy_day)):  # noqa: PTH110
+            if all(isinstance(entry, str) for entry in puzzle_input):
+                _save_shard(legacy_day, "\n".join(puzzle_input) + "\n")
             else:
-                log.warning("Warning website error")
-                return ()
+                log.warning("Day %d in input.p isn't a tuple of strings, it will be fetched again", legacy_day)
+    os.replace(legacy_path, legacy_path + ".migrated")
+    log.info("Migrated %s into per-day text shards", legacy_path)
 
-    if data_list[-1] == "":  # noqa: PLC1901
-        data_list.pop(-1)
-    if cast is not None:
-        data_list = [cast(x) for x in data_list]
-    return tuple(data_list)
+
+def _migrate_legacy_cache(day, log=_LOG):
+    """
+    Recover a day's raw puzzle text from the pickle cache earlier versions wrote.
+
+    :param day: (int) the AoC day
+    :param log:  logger object
+    :return: (str,None) the recovered text or None if the old cache doesn't have it.
+    """
+    _migrate_legacy_pickle(log)
+    if not path.exists(_shard_path(day)):  # noqa: PTH110
+        return None
+    with open(_shard_path(day), encoding="utf-8", newline="") as shard_file:  # noqa: PTH123, FURB101
+        return shard_file.read()
+
+
+def _load_puzzle_text(day):
+    """
+    Load a day's raw puzzle text from the in-process memo or its on-disk shard.
+
+    :param day: (int) the AoC day
+    :return: (_PuzzleText,None) the memoized text or None on a cache miss.
+    """
+    puzzle_text = _INPUT_MEMO.get(day)
+    if puzzle_text is not None:
+        return puzzle_text
+    if path.exists(_shard_path(day)):  # noqa: SIM108, PTH110
+        with open(_shard_path(day), encoding="utf-8", newline="") as shard_file:  # noqa: PTH123, FURB101
+            text = shard_file.read()
+    else:
+        text = _migrate_legacy_cache(day)
+    if not text:
+        return None
+    puzzle_text = _INPUT_MEMO[day] = _PuzzleText(text)
+    return puzzle_text
 
 
-def get_input(day, seperator, cast, override=False):  # noqa: FBT002
+def _stream_input(day, seperator, cast, override):
+    """
+    Generator behind get_input(stream=True), yields each data element in constant memory.
+
+    A memoized day is split from memory, a cached day from its shard file and a cache miss from the
+    website response body, which is written through to the shard as it streams past.
+    """
+    if type(day) is not int:
+        chunks = (day,)
+    elif override is not True and day in _INPUT_MEMO:
+        chunks = (_INPUT_MEMO[day].text,)
+    elif override is not True and (path.exists(_shard_path(day)) or _migrate_legacy_cache(day)):  # noqa: PTH110
+        chunks = _read_shard_chunks(day)
+    else:
+        validators = _cached_validators(day) if override is True else {}
+        fetched = _fetch_puzzle_chunks(day, validators=validators)
+        first_chunk = next(fetched, None)  # the response headers have been seen once the first chunk arrives
+        if validators.get("not_modified"):
+            chunks = (_INPUT_MEMO[day].text,) if day in _INPUT_MEMO else _read_shard_chunks(day)
+        else:
+            _INPUT_MEMO.pop(day, None)
+            chunks = _tee_to_shard(day, itertools.chain(() if first_chunk is None else (first_chunk,), fetched), validators)
+    yield from _split_puzzle_stream(chunks, seperator, cast)
+
+
+class _Stopwatch:
+    """
+    Splits a day's run time into input loading and each part's compute time.
+
+    get_input charges its time with add_input and the solvers call lap once each part is answered,
+    the time since the previous lap less any input loading in between is charged to that part.
+    Streaming input is charged to the part that consumes it since it's loaded as it's iterated.
+    """
+    def __init__(self):
+        """Instantiates an instance of the class."""
+        self.laps = {}
+        self.input_size = 0
+        self._mark = time.perf_counter()
+        self._input_time = 0.0
+
+    def reset(self):
+        """Clear the laps and start timing from now."""
+        self.laps = {}
+        self.input_size = 0
+        self._mark = time.perf_counter()
+        self._input_time = 0.0
+
+    def add_input(self, seconds, size=0):
+        """Charge time spent loading the puzzle input, and note the size in characters of the largest input loaded."""
+        self.laps["input"] = self.laps.get("input", 0.0) + seconds
+        self.input_size = max(self.input_size, size)
+        self._input_time += seconds
+
+    def lap(self, label):
+        """Charge the compute time since the previous lap to label e.g. "part1"."""
+        now = time.perf_counter()
+        self.laps[label] = self.laps.get(label, 0.0) + (now - self._mark - self._input_time)
+        self._mark = now
+        self._input_time = 0.0
+
+
+_STOPWATCH = _Stopwatch()
+
+
+def _input_size(day):
+    """Return the number of characters in a day's puzzle input without loading it, 0 if it isn't cached."""
+    if type(day) is not int:
+        return len(day)
+    if day in _INPUT_MEMO:
+        return len(_INPUT_MEMO[day].text)
+    if path.exists(_shard_path(day)):  # noqa: PTH110
+        return path.getsize(_shard_path(day))  # noqa: PTH202
+    return 0
+
+
+def _load_input(day, seperator, cast, override, mapped, stream):
+    """The body of get_input, split out so get_input can charge its time to the stopwatch."""
+    if stream:
+        return _stream_input(day, seperator, cast, override)
+    if type(day) is not int:  # Examples are never cached
+        return _pull_puzzle_input(day, seperator, cast)
+    if mapped is None:
+        mapped = _MAPPED_INPUT
+
+    puzzle_text = None
+    if override is not True:
+        if mapped and (path.exists(_shard_path(day)) or _migrate_legacy_cache(day)):  # noqa: PTH110
+            return MappedLines(_shard_path(day), seperator, cast)
+        puzzle_text = _load_puzzle_text(day)
+    if puzzle_text is None:
+        validators = _cached_validators(day) if override is True else {}
+        text = _fetch_puzzle_text(day, validators)
+        if validators.get("not_modified") or (text and _text_digest(text) == validators.get("sha256")):
+            # Nothing changed, keep the cached text and every view already parsed from it
+            if text:
+                _save_meta(day, validators["sha256"], len(text.encode("utf-8")), validators)
+            if mapped:
+                return MappedLines(_shard_path(day), seperator, cast)
+            return _load_puzzle_text(day).view(seperator, cast)
+        if not text:
+            return ()
+        _save_shard(day, text, validators)
+        if mapped:
+            return MappedLines(_shard_path(day), seperator, cast)
+        puzzle_text = _INPUT_MEMO[day] = _PuzzleText(text)
+    return puzzle_text.view(seperator, cast)
+
+
+def get_input(day, seperator, cast, override=False, mapped=None, stream=False):  # noqa: FBT002
     """
     Helper function for the daily puzzle information.
 
-    If the puzzle data does not exist (or is an empty tuple) it attempts to pull it from the website.
-    Caches the puzzle data into a pickle file so that re-runs don't have the performance
-    penalty of fetching from the Advent Of Code website.
+    If the puzzle data does not exist (or is empty) it attempts to pull it from the website.
+    Caches the raw puzzle text into one file per day so that re-runs don't have the performance
+    penalty of fetching from the Advent Of Code website, and a cache hit only reads that day's file.
+    The split/cast views of the text are derived on demand and memoized per (seperator, cast) so asking
+    for the same day with a different shape re-parses the cached text instead of fetching it again.
 
     :param day: (int, str) the AoC day puzzle input to fetch or a string of the puzzle example.
     :param seperator: (str) A string separator to pass into str.split when consuming the puzzle data.
     :param cast: (None,type) A Python function often a type cast (int, str, lambda) to be run against each data element.
                              None - do not apply a function/cast to the data.
     :param override: (bool) True = Fetch the data again instead of using the cached copy.
+    :param mapped: (bool,None) True = return a MappedLines view over the cached file instead of a tuple so
+                   huge inputs are never fully loaded.  None = use _MAPPED_INPUT.  Examples are always tuples.
+    :param stream: (bool) True = return a generator that splits the cached file, or the website response as it
+                   arrives, one element at a time with cast applied lazily.  Takes precedence over mapped.
 
-    :return: tuple containing the puzzle data
+    :return: tuple (or MappedLines, or generator) containing the puzzle data
+    """
+    start_time = time.perf_counter()
+    try:
+        return _load_input(day, seperator, cast, override, mapped, stream)
+    finally:
+        _STOPWATCH.add_input(time.perf_counter() - start_time, _input_size(day))
+
+
+class _Throttle:
+    """Thread-safe rate limiter that spaces calls to wait() at least min_interval seconds apart."""
+    def __init__(self, min_interval):
+        """Instantiates an instance of the class."""
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self):
+        """Block until the caller is allowed to make its request."""
+        with self._lock:
+            now = time.monotonic()
+            start_time = max(now, self._next_time)
+            self._next_time = start_time + self.min_interval
+        if start_time > now:
+            time.sleep(start_time - now)
+
+
+def _prefetch_day(session, day, throttle, log=_LOG):
+    """
+    Fetch a single day's input with a shared session and file it in the get_input cache.
+
+    :return: (bool) True if the input was fetched and cached.
+    """
+    validators = _cached_validators(day)
+    throttle.wait()
+    resp = session.get(_puzzle_url(day), headers=_conditional_headers(validators), timeout=_HTTP_TIMEOUT)
+    if resp.status_code == 304:
+        return True
+    if not resp.ok:
+        log.warning("Day %d website error %d", day, resp.status_code)
+        return False
+    resp.encoding = resp.encoding or "utf-8"
+    text = resp.text
+    if not text:
+        return False
+    _save_shard(day, text, {"etag": resp.headers.get("ETag"), "last_modified": resp.headers.get("Last-Modified")})
+    _INPUT_MEMO[day] = _PuzzleText(text)
+    return True
+
+
+def prefetch_inputs(days=range(1, 26), max_workers=4, min_interval=0.25, override=False, log=_LOG):  # noqa: FBT002
     """
-    if path.exists(_CODE_PATH + rf"\{_YEAR}\input.p"):  # noqa: SIM108, PTH110
-        puzzle_dict = pickle.load(open(_CODE_PATH + rf"\{_YEAR}\input.p", "rb"))  # noqa: S301, SIM115, PTH123
-    else:  # No pickle file, will need to make a new one.
-        puzzle_dict = {}
+    Pull every missing day's puzzle input concurrently into the get_input cache.
 
-    puzzle_input = puzzle_dict.get(day, None)
+    Connectivity, proxies and the session cookie are resolved once and a single pooled session is shared by
+    at most max_workers threads, with requests started no closer together than min_interval seconds.
 
-    if not puzzle_input or override is True:
-        puzzle_input = _pull_puzzle_input(day, seperator, cast)
-        if type(day) is int:  # only save the full puzzle data to the pickle file.
-            puzzle_dict[day] = puzzle_input
-            pickle.dump(puzzle_dict, open(_CODE_PATH + rf"\{_YEAR}\input.p", "wb"))  # noqa: PTH123, SIM115
-    return puzzle_input
+    Args:
+        days (iterable): The days of December to fetch
+        max_workers (int): Maximum number of requests in flight
+        min_interval (float): Minimum number of seconds between starting requests
+        override (bool): True = Fetch days that are already cached as well
+        log (slt.EasyLogger, optional): Logger object
+    Returns:
+        dictionary of {day: bool} for each day that was fetched, True if it succeeded.
+    """
+    if _OFFLINE:
+        return {}
+    if override is not True:
+        _migrate_legacy_pickle(log)  # days the old cache has don't need fetching
+    missing = [day for day in days if override is True or (day not in _INPUT_MEMO and not path.exists(_shard_path(day)))]  # noqa: PTH110
+    if not missing:
+        return {}
+
+    log.result(slt.FG.icyan("Pulling Data Set for days %s" % missing))
+    fetched = {}
+    throttle = _Throttle(min_interval)
+    with requests.Session() as session:
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(_request_headers())
+        session.proxies.update(_resolve_proxies())
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(_prefetch_day, session, day, throttle, log): day for day in missing}
+            for future in as_completed(futures):
+                day = futures[future]
+                try:
+                    fetched[day] = future.result()
+                except requests.RequestException:
+                    log.exception("Day %d fetch failed", day)
+                    fetched[day] = False
+    return dict(sorted(fetched.items()))
+
+
+class DayResult:
+    """The structured outcome of solving a day's puzzle."""
+    def __init__(self, day, answers, timings=None, input_size=0, status=None, error=None):
+        """
+        Instantiates an instance of the class.
+
+        Args:
+            day (int):  Which day in December
+            answers (list):  The answer to each part solved so far
+            timings (dict):  {label: seconds} from the stopwatch e.g. "input", "part1", "part2"
+            input_size (int):  Number of characters in the puzzle input
+            status (str):  "Completed", "Unfinished" or "Broken", defaults to what the answers imply
+            error (str):  The traceback of a Broken day
+        """
+        self.day = day
+        self.answers = answers
+        self.timings = timings or {}
+        self.input_size = input_size
+        if status is None:
+            status = "Completed" if len(answers) == 2 else "Unfinished"
+        self.status = status
+        self.error = error
+
+    def __str__(self):
+        """Return a string representation of the class instance."""
+        return f"Day {self.day} {self.status}: {self.answers}"
+
+    def as_dict(self):
+        """Return the result as a JSON friendly dictionary."""
+        return {"day": self.day, "answers": self.answers, "timings": self.timings,
+                "input_size": self.input_size, "status": self.status, "error": self.error}
+
+    def show(self, log=_LOG):
+        """Show the results in a common format with the given logger."""
+        log.result("")
+        if self.status == "Broken":
+            log.error("Day %d threw Exception\n%s", self.day, self.error)
+        elif not self.answers:
+            log.warning("Day %d Unsolved", self.day)
+        else:
+            log.result("Day %d Results:", self.day)
+            for i, result in enumerate(self.answers, start=1):
+                if isinstance(result, int):
+                    log.result("  Part %d:   %d", i, result)
+                else:
+                    log.result("  Part %d:   %s", i, result)
 
 
 def display_results(day, results, log=_LOG):
@@ -139,7 +862,7 @@ def display_results(day, results, log=_LOG):
         results (list):  A list of result solutions for the day's puzzle.
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results given.
+        DayResult with the results plus the stopwatch's timings and input size, which is then reset for the next day.
     """
     if not isinstance(day, int):
         err_str = f"day={day} invalid.  Must be int, not {type(day)}"
@@ -151,17 +874,43 @@ def display_results(day, results, log=_LOG):
         err_str = f"log={log} invalid.  Must be an slt.EasyLogger not {type(log)}"
         raise TypeError(err_str)
 
-    log.result("")
-    if not results:
-        log.warning("Day %d Unsolved", day)
-    else:
-        log.result("Day %d Results:", day)
-        for i, result in enumerate(results, start=1):
-            if isinstance(result, int):
-                log.result("  Part %d:   %d", i, result)
-            else:
-                log.result("  Part %d:   %s", i, result)
-    return len(results)
+    day_result = DayResult(day, list(results), timings=dict(_STOPWATCH.laps), input_size=_STOPWATCH.input_size)
+    _STOPWATCH.reset()
+    day_result.show(log=log)
+    return day_result
+
+
+def _tracing(log=_LOG):
+    """
+    Return True when a solver should emit its per line/item debug tracing.
+
+    Solvers check this once before a hot loop instead of calling log.debug on every iteration, which costs the
+    logger dispatch (and any argument building) even when nothing is shown.  _FAST turns tracing off entirely.
+    """
+    return not _FAST and log.isEnabledFor(logging.DEBUG)
+
+
+def _calibration_sum(lines):
+    """
+    Sum the two digit number made of the first and last digit on each line, for every line at once.
+
+    The lines are joined into one byte buffer, each digit is tagged with the line it's on and the first and last
+    digit of each line are the two ends of its run of tags. Lines without a digit don't add anything.
+
+    Args:
+        lines (iterable): the calibration document's lines
+    Returns:
+        int the sum of the calibration values
+    """
+    buffer = np.frombuffer("\n".join(lines).encode(), dtype=np.uint8)
+    digits = np.flatnonzero((buffer >= ord("0")) & (buffer <= ord("9")))
+    if not digits.size:
+        return 0
+    line_of_digit = np.searchsorted(np.flatnonzero(buffer == ord("\n")), digits)
+    line_breaks = np.flatnonzero(np.diff(line_of_digit)) + 1
+    firsts = digits[np.concatenate(([0], line_breaks))]
+    lasts = digits[np.concatenate((line_breaks - 1, [len(digits) - 1]))]
+    return int(((buffer[firsts] - ord("0")) * 10 + (buffer[lasts] - ord("0"))).sum(dtype=np.int64))
 
 
 def day1(use_example=False, log=_LOG):  # noqa: FBT002
@@ -172,7 +921,7 @@ def day1(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     results = [0, 0]
@@ -192,29 +941,52 @@ def day1(use_example=False, log=_LOG):  # noqa: FBT002
                       "a1b2c3d4e5f\n"
                       "treb7uchet\n")
         data_tuple = get_input(di, "\n", str, override=False)
-        for line in data_tuple:
-            digit_list = []
-            if part2:
-                log.debug("line: %s", line)
-                # Jam the actual digit into the digit name
-                for digit, digit_name in enumerate(["zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]):
-                    index = line.find(digit_name)
-                    while index != -1:  # find all occurrances
-                        index += 2  # digit_names can overlap by a character
-                        line = line[:index] + f"{digit}" + line[index:]  # noqa: PLW2901
-                        index = line.find(digit_name)
-            log.debug("line: %s", line)
-            for char in line:
-                if char.isdigit():
-                    digit_list.append(char)  # noqa: PERF401
-            if len(digit_list) < 1:
-                continue
-            line_num = int(digit_list[0] + digit_list[-1])
-            log.debug("line_num: %d", line_num)
-            results[part2] += line_num
+        if not part2:
+            results[part2] = _calibration_sum(data_tuple)
+        else:
+            trace = _tracing(log)
+            for line in data_tuple:
+                first = _FIRST_DIGIT.search(line)
+                if first is None:
+                    continue
+                line_num = _DIGIT_VALUES[first.group()] * 10 + _DIGIT_VALUES[_LAST_DIGIT.match(line).group(1)]
+                if trace:
+                    log.debug("line: %s line_num: %d", line, line_num)
+                results[part2] += line_num
+        _STOPWATCH.lap("part%d" % (part2 + 1))
     return display_results(day=day, results=results, log=log)
 
 
+def _cube_maxima(lines):
+    """
+    Parse day2's game records into the most cubes of each color seen in each game.
+
+    One compiled pattern finds every game id and every (count, color) draw, the draws are collected as columns
+    and folded into the maxima with a single np.maximum.at.
+
+    Args:
+        lines (sequence): the game records e.g. "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green"
+    Returns:
+        (game_ids, maxima) NumPy arrays, maxima is (n_games, 3) in _CUBE_COLORS order
+    """
+    color_index = {color: index for index, color in enumerate(_CUBE_COLORS)}
+    game_ids = array("q")
+    rows = array("q")
+    colors = array("q")
+    counts = array("q")
+    for game_id, count, color in _GAME_TOKEN.findall("\n".join(lines)):
+        if game_id:
+            game_ids.append(int(game_id))
+        else:
+            rows.append(len(game_ids) - 1)
+            colors.append(color_index[color])
+            counts.append(int(count))
+    maxima = np.zeros((len(game_ids), len(_CUBE_COLORS)), dtype=np.int64)
+    np.maximum.at(maxima, (np.frombuffer(rows, dtype=np.int64), np.frombuffer(colors, dtype=np.int64)),
+                  np.frombuffer(counts, dtype=np.int64))
+    return np.frombuffer(game_ids, dtype=np.int64), maxima
+
+
 def day2(use_example=False, log=_LOG):  # noqa: FBT002
     """
     Cube Conundrum.
@@ -223,7 +995,7 @@ def day2(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -235,36 +1007,17 @@ def day2(use_example=False, log=_LOG):  # noqa: FBT002
     data_tuple = get_input(di, "\n", str, override=False)
     results = []
 
-    # Parse the strings into a list of dictionaries
-    game_list = []
-    for line in data_tuple:
-        max_count_dict = {"red": 0, "green": 0, "blue": 0}
-        # Throw away the game id and split into rounds e.g. "3 blue, 4 red"
-        round_list = line.split(":")[1].split(";")
-        for round_str in round_list:
-            # split into sets of colors e.g. "3 blue"
-            color_list = round_str.split(",")
-            for entry in color_list:
-                color_count_list = entry.rsplit()  # e.g. ['3', 'blue']
-                # Keep track of the maximum cubes seen for each color in this game
-                max_count_dict[color_count_list[1]] = max(max_count_dict[color_count_list[1]], int(color_count_list[0]))
-        game_list.append(max_count_dict)
-
-    for g_id, entry in enumerate(game_list, start=1):
-        log.debug("Game %d: %s", g_id, entry)
-    log.debug("")
+    game_ids, maxima = _cube_maxima(data_tuple)
+    _STOPWATCH.lap("parse")
+    log.debug("Most cubes of each color %s per game:\n%s", _CUBE_COLORS, maxima)
+
+    possible = (maxima <= _CUBE_LIMITS).all(axis=1)
+    log.debug("Possible games: %s", game_ids[possible])
+    results.append(int(game_ids[possible].sum()))
+    _STOPWATCH.lap("part1")
 
-    possible_games_sum = 0
-    power_sum = 0
-    for g_id, game_count_dict in enumerate(game_list, start=1):
-        power = game_count_dict["red"] * game_count_dict["green"] * game_count_dict["blue"]
-        power_sum += power
-        output_str = f"game {id} power={power}"
-        if game_count_dict["red"] <= 12 and game_count_dict["green"] <= 13 and game_count_dict["blue"] <= 14:
-            output_str += " and is possible"
-            possible_games_sum += g_id
-        log.debug(output_str)
-    results.extend((possible_games_sum, power_sum))
+    results.append(int(maxima.prod(axis=1).sum()))
+    _STOPWATCH.lap("part2")
 
     return display_results(day=day, results=results, log=log)
 
@@ -302,15 +1055,84 @@ def show_diagram(diagram, cur_r=-1, cur_c=-1, hl_r=-1, hl_c=-1, log_level="debug
     log.log(log_level_value, "")
 
 
+class Schematic:
+    """
+    An engine schematic as a NumPy array of character codes, padded with a border of "." all the way round.
+
+    Every run of digits is labelled once in number_ids, an index into values where 0 is the cells that aren't part
+    of a number, so finding numbers next to something is a mask lookup rather than a walk.
+    """
+    BLANK = ord(".")
+
+    def __init__(self, lines):
+        """
+        Instantiates an instance of the class.
+
+        Args:
+            lines (sequence): the rows of the schematic, all the same length
+        """
+        rows = np.frombuffer("".join(lines).encode(), dtype=np.uint8).reshape(len(lines), -1)
+        self.chars = np.pad(rows, 1, constant_values=self.BLANK)
+        self.is_digit = (self.chars >= ord("0")) & (self.chars <= ord("9"))
+        self.is_symbol = ~self.is_digit & (self.chars != self.BLANK)
+
+        # A number starts on a digit with no digit to its left, the padding keeps runs from wrapping round rows
+        flat_digits = self.is_digit.ravel()
+        starts = flat_digits & ~np.roll(flat_digits, 1)
+        ends = np.flatnonzero(flat_digits & ~np.roll(flat_digits, -1))
+        self.number_ids = (np.cumsum(starts) * flat_digits).reshape(self.chars.shape)
+        # Each digit is worth 10 ** (how far it is from the end of its number)
+        digit_cells = np.flatnonzero(flat_digits)
+        digit_ids = self.number_ids.ravel()[digit_cells]
+        self.values = np.zeros(len(ends) + 1, dtype=np.int64)
+        np.add.at(self.values, digit_ids,
+                  (self.chars.ravel()[digit_cells] - ord("0")) * 10 ** (ends[digit_ids - 1] - digit_cells))
+
+    def neighbours(self, cells):
+        """
+        Return the number ids around each cell, one row of 9 per cell including the cell itself.
+
+        Args:
+            cells (tuple): (rows, cols) index arrays e.g. from np.nonzero, none of them on the padding
+        """
+        rows, cols = cells
+        return np.stack([self.number_ids[rows + row_mod, cols + col_mod]
+                         for row_mod in (-1, 0, 1) for col_mod in (-1, 0, 1)], axis=1)
+
+    def dilate(self, mask):
+        """Return mask grown by one cell in all 8 directions."""
+        grown = mask.copy()
+        height, width = mask.shape
+        for row_mod in (-1, 0, 1):
+            for col_mod in (-1, 0, 1):
+                grown[max(row_mod, 0):height + min(row_mod, 0), max(col_mod, 0):width + min(col_mod, 0)] |= \
+                    mask[max(-row_mod, 0):height + min(-row_mod, 0), max(-col_mod, 0):width + min(-col_mod, 0)]
+        return grown
+
+    def part_numbers(self):
+        """Return the values of the numbers with a symbol in any of the 8 cells around them."""
+        touching = self.dilate(self.is_symbol) & self.is_digit
+        return self.values[np.unique(self.number_ids[touching])]
+
+    def gear_ratios(self, gear="*"):
+        """Return the product of the numbers around each gear symbol that has more than one number around it."""
+        around = np.sort(self.neighbours(np.nonzero(self.chars == ord(gear))), axis=1)
+        # Count each number once however many of its digits touch the gear
+        distinct = around != 0
+        distinct[:, 1:] &= around[:, 1:] != around[:, :-1]
+        factors = np.where(distinct, self.values[around], 1)
+        return np.prod(factors, axis=1)[distinct.sum(axis=1) > 1]
+
+
 def day3(use_example=False, log=_LOG):  # noqa: FBT002
     """
-    Unsolved.
+    Gear Ratios.
 
     Args:
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -327,89 +1149,29 @@ def day3(use_example=False, log=_LOG):  # noqa: FBT002
     data_tuple = get_input(di, "\n", str, override=False)
     results = []
 
-    # Create the diagram
-    diagram = []
-    first_last_row = ["."] * (len(data_tuple[0]) + 2)
-    diagram.append(first_last_row)
-    for line in data_tuple:
-        row_list = ["."]
-        row_list.extend(list(line))
-        row_list.append(".")
-        diagram.append(row_list)
-    diagram.append(first_last_row)
-    # show_diagram(diagram, log=log)
-
-    # Walk the diagram looking for numbers
-    part_number = 0
-    cur_num_str = None
-    valid = False
-    for r, row in enumerate(diagram):
-        for c, cell in enumerate(row):
-            if cell.isdigit():
-                if cur_num_str is None:  # first digit of number
-                    cur_num_str = cell
-                    valid = False
-                else:
-                    cur_num_str += cell
-                # Search the neighbors for a symbol
-                for row_mod in [-1, 0, 1]:
-                    for col_mod in [-1, 0, 1]:
-                        if row_mod == 0 and col_mod == 0:  # Skip yourself
-                            continue
-                        nr = r + row_mod
-                        nc = c + col_mod
-                        if diagram[nr][nc] != "." and not diagram[nr][nc].isalnum():  # symbol
-                            valid = True
-            elif cur_num_str is not None:  # end of the number
-                if valid:
-                    log.debug("Found Valid Part Number %s", cur_num_str)
-                    part_number += int(cur_num_str)
-                # Reset to look for the next number
-                cur_num_str = None
-                valid = False
-    results.append(part_number)
+    schematic = Schematic(data_tuple)
+    part_numbers = schematic.part_numbers()
+    log.debug("Found Valid Part Numbers %s", part_numbers)
+    results.append(int(part_numbers.sum()))
+    _STOPWATCH.lap("part1")
     log.debug("*" * 79)
 
     # Part 2
-    # Walk the diagram looking for Gears (*)
-    gear_ratio_sum = 0
-    for r, row in enumerate(diagram):
-        for c, cell in enumerate(row):
-            if cell == "*":
-                # Look for neighboring numbers
-                number_neighbors = []
-                for row_mod in [-1, 0, 1]:
-                    for col_mod in [-1, 0, 1]:
-                        if row_mod == 0 and col_mod == 0:  # Skip yourself
-                            continue
-                        nr = r + row_mod
-                        nc = c + col_mod
-                        if diagram[nr][nc].isdigit():  # Found a number
-                            # figure out the whole number
-                            num_str = diagram[nr][nc]
-                            # look left
-                            tmp_col = nc - 1
-                            while diagram[nr][tmp_col].isdigit():
-                                num_str = diagram[nr][tmp_col] + num_str
-                                tmp_col -= 1
-                            # look right
-                            tmp_col = nc + 1
-                            while diagram[nr][tmp_col].isdigit():
-                                num_str += diagram[nr][tmp_col]
-                                tmp_col += 1
-                            if int(num_str) not in number_neighbors:
-                                number_neighbors.append(int(num_str))
-                if len(number_neighbors) > 1:
-                    # Calculate gear ratio
-                    gear_ratio = 1
-                    for entry in number_neighbors:
-                        gear_ratio *= entry
-                    log.debug("Found Gear Ratio %6d: %s", gear_ratio, number_neighbors)
-                    gear_ratio_sum += gear_ratio
-    results.append(gear_ratio_sum)
+    gear_ratios = schematic.gear_ratios()
+    log.debug("Found Gear Ratios %s", gear_ratios)
+    results.append(int(gear_ratios.sum()))
+    _STOPWATCH.lap("part2")
     return display_results(day=day, results=results, log=log)
 
 
+def _number_mask(numbers):
+    """Return the whitespace separated numbers (all < 100 on a scratchcard) as the set bits of one int."""
+    mask = 0
+    for number in numbers.split():
+        mask |= 1 << int(number)
+    return mask
+
+
 def day4(use_example=False, log=_LOG):  # noqa: FBT002
     """
     Scratchcards puzzle.
@@ -418,7 +1180,7 @@ def day4(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -431,49 +1193,219 @@ def day4(use_example=False, log=_LOG):  # noqa: FBT002
     data_tuple = get_input(di, "\n", str, override=False)
     results = [0, 0]
 
-    card_values = [0]  # dummy
+    trace = _tracing(log)
+    card_wins = []
     for line in data_tuple:
         card_str = line.split(":")[1]  # throw away the card id
-        # Create 2 sets of numbers and the intersection is the number of wins
+        # Each side as a bitmask, the numbers on both sides are the set bits of the AND
         win_num_str, num_str = card_str.split("|")
-        win_num_set = {int(i) for i in win_num_str.split()}
-        num_set = {int(i) for i in num_str.split()}
-        win_set = win_num_set.intersection(num_set)
-        log.debug("win_set: %s", win_set)
-        card_values.append(len(win_set))
+        wins = (_number_mask(win_num_str) & _number_mask(num_str)).bit_count()
+        card_wins.append(wins)
         # calculate points
-        if win_set:
-            points = 2**(len(win_set) - 1)
-            log.debug("points: %d", points)
+        if wins:
+            points = 2**(wins - 1)
+            if trace:
+                log.debug("wins: %d points: %d", wins, points)
             results[0] += points
+    _STOPWATCH.lap("part1")
 
     log.debug("*" * 79)
 
-    # Keep track of the number of cards for each card id
-    card_count = [1] * len(card_values)
-    card_count[0] = 0  # dummy
-    for card_idx, entry in enumerate(card_count):
-        log.debug("idx: %d - %d wins", card_idx, card_values[card_idx])
-        # add the copies
-        for card_value in range(card_values[card_idx]):
-            card_count[card_idx + 1 + card_value] += entry
-        log.debug("card_count: %s", card_count)
-
-    results[1] = sum(card_count)
+    # Each card's copies are added to the next wins cards, a running difference array does that in one pass
+    copies_delta = [0] * (len(card_wins) + 1)
+    copies = 0
+    for card_idx, wins in enumerate(card_wins):
+        copies += copies_delta[card_idx]
+        card_count = 1 + copies
+        if trace:
+            log.debug("idx: %d - %d wins, %d cards", card_idx + 1, wins, card_count)
+        results[1] += card_count
+        if wins:
+            copies_delta[card_idx + 1] += card_count
+            copies_delta[min(card_idx + 1 + wins, len(card_wins))] -= card_count
+
+    _STOPWATCH.lap("part2")
     return display_results(day=day, results=results, log=log)
 
 
+def _merge_intervals(intervals):
+    """Sort half-open [start, end) intervals and merge the ones that overlap or touch."""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class RangeMap:
+    """
+    One of day5's maps as sorted parallel arrays of source starts, stops (exclusive) and offsets.
+
+    Values outside every source range map to themselves.  Lookups bisect the starts so they're O(log n),
+    and an inverse index of the same ranges sorted by destination does the same for reverse lookups.
+    Like the puzzle, the source ranges (and the destination ranges) are expected not to overlap each other.
+    """
+    def __init__(self, ranges):
+        """
+        Instantiates an instance of the class.
+
+        Args:
+            ranges (iterable): (destination_start, source_start, range_length) tuples as given in the puzzle
+        """
+        ranges = sorted((source_start, source_start + length, destination_start - source_start)
+                        for destination_start, source_start, length in ranges)
+        self.starts = array("q", [entry[0] for entry in ranges])
+        self.stops = array("q", [entry[1] for entry in ranges])
+        self.offsets = array("q", [entry[2] for entry in ranges])
+        # Inverse index, the destination ranges sorted by start and the offset back to the source
+        inverse = sorted((start + offset, stop + offset, -offset) for start, stop, offset in ranges)
+        self.inv_starts = array("q", [entry[0] for entry in inverse])
+        self.inv_stops = array("q", [entry[1] for entry in inverse])
+        self.inv_offsets = array("q", [entry[2] for entry in inverse])
+        self._np_arrays = None
+
+    def __len__(self):
+        """Return the number of ranges."""
+        return len(self.starts)
+
+    def __iter__(self):
+        """Yield (source_start, source_stop, offset) for each range in source order."""
+        return zip(self.starts, self.stops, self.offsets)
+
+    def lookup(self, value):
+        """Map a single source value to its destination."""
+        idx = bisect.bisect_right(self.starts, value) - 1
+        if idx >= 0 and value < self.stops[idx]:
+            return value + self.offsets[idx]
+        return value
+
+    def contains(self, value):
+        """Return True if value falls inside one of the source ranges."""
+        idx = bisect.bisect_right(self.starts, value) - 1
+        return idx >= 0 and value < self.stops[idx]
+
+    def reverse_lookup(self, value):
+        """
+        Return every source value that maps to the given destination value, smallest first.
+
+        A destination can be reached through a range, and also by itself when it isn't inside any source range.
+        """
+        sources = []
+        idx = bisect.bisect_right(self.inv_starts, value) - 1
+        if idx >= 0 and value < self.inv_stops[idx]:
+            sources.append(value + self.inv_offsets[idx])
+        if not self.contains(value):
+            sources.append(value)
+        return sorted(sources)
+
+    def lookup_many(self, values):
+        """Map a NumPy array of source values to their destinations in one vectorized pass."""
+        if self._np_arrays is None:
+            self._np_arrays = (np.frombuffer(self.starts, dtype=np.int64),
+                               np.frombuffer(self.stops, dtype=np.int64),
+                               np.frombuffer(self.offsets, dtype=np.int64))
+        starts, stops, offsets = self._np_arrays
+        values = np.asarray(values, dtype=np.int64)
+        if not len(starts):
+            return values.copy()
+        idx = np.searchsorted(starts, values, side="right") - 1
+        safe_idx = idx.clip(0)
+        inside = (idx >= 0) & (values < stops[safe_idx])
+        return values + np.where(inside, offsets[safe_idx], 0)
+
+    def split(self, start, end):
+        """
+        Yield the pieces of the half-open interval [start, end) cut where the source ranges start and stop.
+
+        Yields:
+            (piece_start, piece_end, offset) tuples covering the whole interval in order, offset is 0 for the gaps.
+        """
+        range_count = len(self.starts)
+        # First range that could overlap, the one before it might still stop after start
+        idx = max(bisect.bisect_right(self.starts, start) - 1, 0)
+        while idx < range_count and start < end:
+            source_start = self.starts[idx]
+            source_stop = self.stops[idx]
+            if source_start >= end:
+                break
+            if source_stop > start:
+                if start < source_start:  # gap before this range maps to itself
+                    yield start, source_start, 0
+                    start = source_start
+                stop = min(end, source_stop)
+                yield start, stop, self.offsets[idx]
+                start = stop
+            idx += 1
+        if start < end:
+            yield start, end, 0
+
+    def map_intervals(self, intervals):
+        """
+        Push half-open [start, end) intervals through the map.
+
+        Each interval is split where the source ranges start and stop, the pieces inside a range are
+        shifted by its offset and the gaps between ranges pass through unchanged.
+
+        Args:
+            intervals (list): (start, end) tuples
+        Returns:
+            sorted list of merged (start, end) tuples of the destination values.
+        """
+        mapped = []
+        for start, end in _merge_intervals(intervals):
+            for piece_start, piece_end, offset in self.split(start, end):
+                mapped.append((piece_start + offset, piece_end + offset))  # noqa: PERF401
+        return _merge_intervals(mapped)
+
+    def compose(self, other):
+        """
+        Return a single RangeMap equivalent to looking a value up in this map and then in other.
+
+        Both maps are the identity outside their source ranges, so only the span covering the ranges of both needs
+        splitting.  Each piece of this map is pushed through other and keeps the sum of the two offsets,
+        neighbouring pieces with the same offset are merged and pieces that cancel out are left as gaps.
+        """
+        bounds = [*self.starts, *self.stops, *other.starts, *other.stops]
+        if not bounds:
+            return RangeMap(())
+        pieces = []
+        for piece_start, piece_end, offset in self.split(min(bounds), max(bounds)):
+            for sub_start, sub_end, other_offset in other.split(piece_start + offset, piece_end + offset):
+                total_offset = offset + other_offset
+                if not total_offset:
+                    continue
+                start = sub_start - offset
+                stop = sub_end - offset
+                if pieces and pieces[-1][1] == start and pieces[-1][2] == total_offset:
+                    pieces[-1] = (pieces[-1][0], stop, total_offset)
+                else:
+                    pieces.append((start, stop, total_offset))
+        return RangeMap((start + total_offset, start, stop - start) for start, stop, total_offset in pieces)
+
+
+def _compose_range_maps(map_ranges):
+    """
+    Fold a chain of maps into one RangeMap.
+
+    Args:
+        map_ranges (iterable): a list per map, in the order they're applied, of (destination, source, length) tuples
+    Returns:
+        RangeMap from the first map's source to the last map's destination.
+    """
+    return functools.reduce(RangeMap.compose, (RangeMap(ranges) for ranges in map_ranges))
+
+
 def day5(use_example=False, log=_LOG):  # noqa: FBT002
     """
     If you give a seed a fertilizer.
 
-    Redo P2 tracking ranges.
-
     Args:
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -514,7 +1446,7 @@ def day5(use_example=False, log=_LOG):  # noqa: FBT002
     results = []
 
     seed_list = []
-    # Each map has a list of dictionaries with format {"source_start": #, "source_end": #, "offset": #}
+    # Each map is a list of (destination_start, source_start, range_length) tuples
     maps = OrderedDict()
     maps["seed-to-soil"] = []
     maps["soil-to-fertilizer"] = []
@@ -534,111 +1466,71 @@ def day5(use_example=False, log=_LOG):  # noqa: FBT002
             if cur_key not in maps:
                 err_str = f"cur_key {cur_key} not in maps"
                 raise RuntimeError(err_str)
-            num_list = [int(i) for i in line.split()]
-            destination_start = num_list[0]
-            source_start = num_list[1]
-            range_length = num_list[2]
-            maps[cur_key].append({"source_start": source_start,
-                                  "source_end": source_start + range_length - 1,
-                                  "offset": destination_start - source_start})
+            destination_start, source_start, range_length = (int(i) for i in line.split())
+            maps[cur_key].append((destination_start, source_start, range_length))
         else:  # map name
             cur_key = line.split()[0]
 
     # Show the maps
-    log.debug("")
-    for map_key, map_list in maps.items():
-        log.debug("%s", map_key)
-        for entry in map_list:
-            output_str = ""
-            for key, value in entry.items():
-                output_str += f"  {key}: {value}"
-            log.debug(output_str)
-
-    # Use the maps to determine the location of each seed
-    locations = []
-    for seed in seed_list:
-        cur_value = next_value = seed
+    trace = _tracing(log)
+    if trace:
         log.debug("")
-        log.debug("seed %d", seed)
-        for mapping_key, map_dict in maps.items():
-            next_value = cur_value
-            for entry in map_dict:
-                if entry["source_start"] <= cur_value <= entry["source_end"]:
-                    next_value = cur_value + entry["offset"]
-            cur_value = next_value
-            log.debug("%s: %d", mapping_key, next_value)
-        locations.append(next_value)
-    results.append(min(locations))
-
-    # Part 2, go backwards from walking up locations back to a seed, then see if it falls within the seed ranges
+        for map_key, range_list in maps.items():
+            log.debug("%s", map_key)
+            for destination_start, source_start, range_length in range_list:
+                log.debug("  destination_start: %d  source_start: %d  range_length: %d", destination_start, source_start, range_length)
+
+    # Fold the seven maps into a single seed-to-location map shared by both parts
+    seed_to_location = _compose_range_maps(maps.values())
+    if trace:
+        log.debug("seed-to-location")
+        for source_start, source_stop, offset in seed_to_location:
+            log.debug("  source_start: %d  source_stop: %d  offset: %d", source_start, source_stop, offset)
+
+    # Use the composed map to determine the location of every seed at once
+    locations = seed_to_location.lookup_many(np.array(seed_list, dtype=np.int64))
+    log.debug("")
+    log.debug("locations: %s", locations)
+    results.append(int(locations.min()))
+    _STOPWATCH.lap("part1")
+
+    # Part 2, push whole seed intervals through the map, splitting them where the map's ranges start and end
     seed_ranges = []
     for i in range(0, len(seed_list), 2):
         seed_ranges.append((seed_list[i], seed_list[i] + seed_list[i + 1]))  # noqa: PERF401
-    log.debug("seed_ranges:")
-    for entry in seed_ranges:
-        log.debug("  %10d - %10d  (%d)", entry[0], entry[1], entry[1] - entry[0])
-
-    start_time = time.time()
-    # htl_idx = 0
-    # location_offset = 0
-    # location = -1
-    location = -1
-    while 1:
-        location += 1
-        # if location >= maps["humidity-to-location"][htl_idx]["source_end"]:
-        #     htl_idx += 1
-        #     location_offset = 0
-        # location = maps["humidity-to-location"][htl_idx]["source_start"] + maps["humidity-to-location"][htl_idx]["offset"] + location_offset
-        # location_offset += 1
-
-        cur_value = humidity = location
-        for entry in maps["humidity-to-location"]:
-            if entry["source_start"] + entry["offset"] <= cur_value <= entry["source_end"] + entry["offset"]:
-                humidity = cur_value - entry["offset"]
-
-        cur_value = temperature = humidity
-        for entry in maps["temperature-to-humidity"]:
-            if entry["source_start"] + entry["offset"] <= cur_value <= entry["source_end"] + entry["offset"]:
-                temperature = cur_value - entry["offset"]
-
-        cur_value = light = temperature
-        for entry in maps["light-to-temperature"]:
-            if entry["source_start"] + entry["offset"] <= cur_value <= entry["source_end"] + entry["offset"]:
-                light = cur_value - entry["offset"]
-
-        cur_value = water = light
-        for entry in maps["water-to-light"]:
-            if entry["source_start"] + entry["offset"] <= cur_value <= entry["source_end"] + entry["offset"]:
-                water = cur_value - entry["offset"]
-
-        cur_value = fertilizer = water
-        for entry in maps["fertilizer-to-water"]:
-            if entry["source_start"] + entry["offset"] <= cur_value <= entry["source_end"] + entry["offset"]:
-                fertilizer = cur_value - entry["offset"]
-
-        cur_value = soil = fertilizer
-        for entry in maps["soil-to-fertilizer"]:
-            if entry["source_start"] + entry["offset"] <= cur_value <= entry["source_end"] + entry["offset"]:
-                soil = cur_value - entry["offset"]
-
-        cur_value = seed = soil
-        for entry in maps["seed-to-soil"]:
-            if entry["source_start"] + entry["offset"] <= cur_value <= entry["source_end"] + entry["offset"]:
-                seed = cur_value - entry["offset"]
-
-        # log.debug("location %d maps to seed %d", location, seed)
-        seed_found = False
+    if trace:
+        log.debug("seed_ranges:")
         for entry in seed_ranges:
-            if entry[0] <= seed <= entry[1]:
-                results.append(location)
-                seed_found = True
-                break
-        if seed_found:
-            break
-    log.result("P2 took %d seconds", time.time() - start_time)
+            log.debug("  %10d - %10d  (%d)", entry[0], entry[1], entry[1] - entry[0])
+
+    intervals = seed_to_location.map_intervals(seed_ranges)
+    log.debug("locations: %d intervals", len(intervals))
+    results.append(intervals[0][0])
+    _STOPWATCH.lap("part2")
     return display_results(day=day, results=results, log=log)
 
 
+def _race_ways_to_win(max_time, min_distance):
+    """
+    Count the whole millisecond button times that beat the record distance.
+
+    Holding the button for b ms travels b * (max_time - b) mm, so the winners are the integers strictly between
+    the roots of b^2 - max_time*b + min_distance.  math.isqrt gives the shorter root exactly for any size of
+    integer and the winners are symmetric around max_time / 2, so it's O(1) per race instead of a simulation.
+    """
+    discriminant = max_time * max_time - 4 * min_distance
+    if discriminant <= 0:  # The best possible time only ties the record at most
+        return 0
+    shortest = max((max_time - math.isqrt(discriminant)) // 2, 0)
+    # isqrt floors, so step onto the first winning time (at most a step or two)
+    while shortest <= max_time - shortest and shortest * (max_time - shortest) <= min_distance:
+        shortest += 1
+    while shortest > 0 and (shortest - 1) * (max_time - shortest + 1) > min_distance:
+        shortest -= 1
+    longest = max_time - shortest
+    return max(longest - shortest + 1, 0)
+
+
 def day6(use_example=False, log=_LOG):  # noqa: FBT002
     """
     Wait For It.
@@ -647,7 +1539,7 @@ def day6(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -674,33 +1566,114 @@ def day6(use_example=False, log=_LOG):  # noqa: FBT002
             race_list.append({"max_time": entry, "min_distance": dist_list[i], "ways_to_win": 0})
 
         for race_num, race_dict in enumerate(race_list):
-            log.debug("Race %d:", race_num)
-            button_time = 0
-            started_winning = False
-            while button_time < race_dict["max_time"]:
-                time_left = race_dict["max_time"] - button_time
-                distance = button_time * time_left
-                output_str = f"button {button_time}ms travels {distance}mm"
-                if distance > race_dict["min_distance"]:
-                    race_dict["ways_to_win"] += 1
-                    output_str += " and wins"
-                    if not started_winning:
-                        started_winning = True
-                elif started_winning:
-                    break
-                # log.debug(output_str)
-                button_time += 1
+            race_dict["ways_to_win"] = _race_ways_to_win(race_dict["max_time"], race_dict["min_distance"])
+            log.debug("Race %d: %d ways to win", race_num, race_dict["ways_to_win"])
             results[part2] *= race_dict["ways_to_win"]
+        _STOPWATCH.lap("part%d" % (part2 + 1))
 
     return display_results(day=day, results=results, log=log)
 
+
+class HandTable:
+    """
+    Every hand of Camel Cards stored column-wise in NumPy arrays.
+
+    cards holds each card as its index into CARD_ORDER, bids the bids and worth the hand type for each part.
+    Both parts' worth come from one 13-bin histogram of the cards in each hand, built for every hand at once.
+    """
+    CARD_ORDER = "23456789TJQKA"
+    JOKER = CARD_ORDER.index("J")
+    # Hand type by (highest card count, second highest card count)
+    WORTH_TABLE = np.zeros((6, 6), dtype=np.int8)
+    WORTH_TABLE[1, 1] = 0  # high card
+    WORTH_TABLE[2, 1] = 1  # one pair
+    WORTH_TABLE[2, 2] = 2  # two pair
+    WORTH_TABLE[3, 1] = 3  # three of kind
+    WORTH_TABLE[3, 2] = 4  # full house
+    WORTH_TABLE[4, 1] = 5  # four of kind
+    WORTH_TABLE[5, 0] = 6  # five of kind
+
+    def __init__(self, lines):
+        """
+        Instantiates an instance of the class.
+
+        Args:
+            lines (iterable): puzzle lines of 5 cards and a bid e.g. "32T3K 765"
+        """
+        card_bytes = bytearray()
+        bids = array("q")
+        for line in lines:
+            cards, bid = line.split()
+            card_bytes += cards.encode()
+            bids.append(int(bid))
+        card_index = np.full(256, -1, dtype=np.int8)
+        card_index[np.frombuffer(self.CARD_ORDER.encode(), dtype=np.uint8)] = np.arange(len(self.CARD_ORDER))
+        self.cards = card_index[np.frombuffer(bytes(card_bytes), dtype=np.uint8)].reshape(-1, 5)
+        self.bids = np.frombuffer(bids, dtype=np.int64)
+
+        # Count the cards in each hand, row = hand, column = card
+        counts = np.zeros((len(self.bids), len(self.CARD_ORDER)), dtype=np.int8)
+        np.add.at(counts, (np.arange(len(self.bids))[:, None], self.cards), 1)
+        self.worth = np.empty((2, len(self.bids)), dtype=np.int8)
+        self.worth[0] = self._worth(counts)
+        # Part 2, jokers join whichever other card there is most of (or are five of a kind by themselves)
+        jokers = counts[:, self.JOKER].copy()
+        counts[:, self.JOKER] = 0
+        self.worth[1] = self._worth(counts, jokers)
+
+    @classmethod
+    def _worth(cls, counts, jokers=0):
+        """Return each hand's worth from its card count histogram, adding any jokers to the biggest count."""
+        top_two = -np.sort(-counts, axis=1)[:, :2]
+        return cls.WORTH_TABLE[top_two[:, 0] + jokers, top_two[:, 1]]
+
+    def __len__(self):
+        """Return the number of hands."""
+        return len(self.bids)
+
+    def keys(self, part2=False):  # noqa: FBT002
+        """
+        Return each hand's sort key for the given part as an int64 array.
+
+        The worth and then each card's strength (4 bits apiece) are packed into one integer so that comparing keys
+        compares the hand type first and breaks ties card by card left to right.  Jokers are the weakest in part 2.
+        """
+        strengths = self.cards.astype(np.int64) + 2
+        if part2:
+            strengths[self.cards == self.JOKER] = 1
+        keys = self.worth[int(part2)].astype(np.int64)
+        for card_idx in range(5):
+            keys = (keys << 4) | strengths[:, card_idx]
+        return keys
+
+    def ranking(self, part2=False):  # noqa: FBT002
+        """Return the hand indices from weakest to strongest for the given part."""
+        return np.argsort(self.keys(part2), kind="stable")
+
+
 class Hand:
-    """A structure to hold information about a hand of cards."""
-    def __init__(self, cards, bid):
+    """A lightweight view of a single hand in a HandTable."""
+    __slots__ = ("index", "table")
+
+    def __init__(self, table, index):
         """Instantiates an instance of the class."""
-        self.cards = cards
-        self.bid = bid
-        self.worth = None
+        self.table = table
+        self.index = index
+
+    @property
+    def cards(self):
+        """Return the cards as a string e.g. "32T3K"."""
+        return "".join(HandTable.CARD_ORDER[card] for card in self.table.cards[self.index])
+
+    @property
+    def bid(self):
+        """Return the bid."""
+        return int(self.table.bids[self.index])
+
+    @property
+    def worth(self):
+        """Return the (part 1, part 2) worth."""
+        return int(self.table.worth[0, self.index]), int(self.table.worth[1, self.index])
 
     def __str__(self):
         """Return a string representation of the class instance."""
@@ -709,6 +1682,7 @@ class Hand:
             ret_str += "  <-----------------"
         return ret_str
 
+
 def day7(use_example=False, log=_LOG):  # noqa: FBT002
     """
     Camel Cards.
@@ -717,7 +1691,7 @@ def day7(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -729,107 +1703,279 @@ def day7(use_example=False, log=_LOG):  # noqa: FBT002
     data_tuple = get_input(di, "\n", str, override=False)  # noqa: F841
     results = []
 
+    hands = HandTable(data_tuple)
+    _STOPWATCH.lap("parse")
+    trace = _tracing(log)
     for part2 in range(2):
+        # sort the hands based on the packed key
+        ranking = hands.ranking(part2=bool(part2))
+        if trace:
+            log.debug("hands_list:")
+            for idx in ranking:
+                log.debug(Hand(hands, idx))
+
+        total_winnings = int(np.dot(np.arange(1, len(hands) + 1, dtype=np.int64), hands.bids[ranking]))
+        results.append(total_winnings)
+        _STOPWATCH.lap("part%d" % (part2 + 1))
 
-        hands_list = []
-        for line in data_tuple:
-            cards, bid = line.split()
-            hands_list.append(Hand(cards, int(bid)))
-
-        # determine worth
-        # worth_dict for readability
-        worth_dict = {"high card": 0, "one pair": 1, "two pair": 2, "three of kind": 3,
-                    "full house": 4, "four of kind": 5, "five of kind": 6}
-        for hand in hands_list:
-            log.debug(hand.cards)
-            # Track the count of each unique card in the hand
-            card_count = {}
-            for card in hand.cards:
-                if card in card_count:
-                    card_count[card] += 1
-                else:
-                    card_count[card] = 1
-            # apply jokers to the next highest card count
-            if part2 and "J" in card_count and len(card_count) > 1:
-                highest_count = -1
-                highest_key = None
-                for key, value in card_count.items():
-                    if key != "J" and value > highest_count:
-                        highest_count = value
-                        highest_key = key
-                card_count[highest_key] += card_count["J"]
-                card_count.pop("J")
-
-            # Use the card_count dictionary to determine the sortable worth of the hand
-            len_card_count = len(card_count)
-            if len_card_count == 5:
-                hand.worth = worth_dict["high card"]
-            elif len_card_count == 4:
-                hand.worth = worth_dict["one pair"]
-            elif len_card_count == 3:
-                if 3 in card_count.values():
-                    hand.worth = worth_dict["three of kind"]
-                else:
-                    hand.worth = worth_dict["two pair"]
-            elif len_card_count == 2:
-                if 4 in card_count.values():
-                    hand.worth = worth_dict["four of kind"]
-                else:
-                    hand.worth = worth_dict["full house"]
-            else:  # 1 card
-                hand.worth = worth_dict["five of kind"]
+    return display_results(day=day, results=results, log=log)
 
-        # sort the hands based on worth
-        hands_list = sorted(hands_list, key=lambda hand: hand.worth)
-        log.debug("hands_list:")
-        for entry in hands_list:
-            log.debug(entry)
 
-        card_strength = {"2": 2, "3": 3, "4": 4, "5": 5, "6": 6, "7": 7, "8": 8, "9": 9, "T": 10, "J": 11, "Q": 12, "K": 13, "A": 14}
-        if part2:
-            card_strength["J"] = 1
-        # Break the ties by comparing each character left to right.
-        # Bubble sort based on the current card index
-        len_hands_list = len(hands_list)
-        for i in range(len_hands_list):
-            swapped = False
-            for j in range(len_hands_list - i - 1):
-                if hands_list[j].worth != hands_list[j + 1].worth:  # not a tie of the same hand type
-                    continue
-                # log.debug("%s ties with", hands_list[j])
-                # log.debug("%s", hands_list[j + 1])
-                for card_index in range(5):
-                    # current card is greater so swap
-                    if card_strength[hands_list[j].cards[card_index]] > card_strength[hands_list[j + 1].cards[card_index]]:
-                        hands_list[j], hands_list[j + 1] = hands_list[j + 1], hands_list[j]
-                        swapped = True
-                    # If the current card is tied, then go to the next card
-                    if card_strength[hands_list[j].cards[card_index]] != card_strength[hands_list[j + 1].cards[card_index]]:
-                        break
-            if not swapped:
-                break
+class NodeMap:
+    """
+    The day8 network compiled to NumPy int arrays indexed by node id.
 
-        total_winnings = 0
-        for i, entry in enumerate(hands_list, start=1):
-            total_winnings += (i * entry.bid)
-        results.append(total_winnings)
+    trail[i] is where every node ends up i + 1 steps into a pass through the directions, so trail[-1] is the jump
+    table for one full pass. Walking a whole pass is then one lookup, and binary lifting over that jump table
+    lands k passes later in O(log k).
+    """
+    def __init__(self, graph_dict, directions):
+        """
+        Instantiates an instance of the class.
 
-    return display_results(day=day, results=results, log=log)
+        Args:
+            graph_dict (dict): {"AAA": ("BBB", "CCC")} node to (left, right) nodes
+            directions (str): the left/right instructions e.g. "LLR"
+        """
+        self.names = list(graph_dict)
+        self.ids = {name: node_id for node_id, name in enumerate(self.names)}
+        self.left = np.fromiter((self.ids[left] for left, _ in graph_dict.values()), dtype=np.intp,
+                                count=len(self.names))
+        self.right = np.fromiter((self.ids[right] for _, right in graph_dict.values()), dtype=np.intp,
+                                 count=len(self.names))
+        self.turns = np.frombuffer(directions.encode(), dtype=np.uint8) == ord("R")
+        # Every node takes each step of a pass at once
+        self.trail = np.empty((len(self.turns), len(self.names)), dtype=np.intp)
+        nodes = np.arange(len(self.names))
+        for step, turn in enumerate(self.turns):
+            nodes = self.right[nodes] if turn else self.left[nodes]
+            self.trail[step] = nodes
+        self._lifts = [self.trail[-1]]  # _lifts[j] jumps 2 ** j passes
+
+    def __len__(self):
+        """Return the number of nodes."""
+        return len(self.names)
+
+    @property
+    def pass_length(self):
+        """Return the number of steps in one pass through the directions."""
+        return len(self.turns)
+
+    @property
+    def cycle_jump(self):
+        """Return where every node lands after one full pass through the directions."""
+        return self._lifts[0]
+
+    def mask(self, predicate):
+        """Return a boolean array over the node ids of the nodes whose names satisfy predicate."""
+        return np.fromiter((predicate(name) for name in self.names), dtype=bool, count=len(self.names))
+
+    def after_passes(self, node, passes):
+        """Return the node reached after the given number of full passes through the directions, in O(log passes)."""
+        level = 0
+        while passes:
+            if level == len(self._lifts):
+                self._lifts.append(self._lifts[-1][self._lifts[-1]])
+            if passes & 1:
+                node = self._lifts[level][node]
+            passes >>= 1
+            level += 1
+        return int(node)
+
+    def walk(self, node, steps):
+        """Return the node reached after the given number of steps, starting at the beginning of the directions."""
+        passes, steps = divmod(steps, self.pass_length)
+        node = self.after_passes(node, passes)
+        return int(self.trail[steps - 1, node]) if steps else node
+
+    def pass_hits(self, node, targets):
+        """
+        Return the steps (1 to pass_length) within a pass starting at node that land on a target node.
+
+        Args:
+            node (int): node id at the start of the pass
+            targets (np.ndarray): boolean mask over the node ids
+        """
+        return np.flatnonzero(targets[self.trail[:, node]]) + 1
+
+    def steps_to(self, node, targets):
+        """
+        Return the first step from node that lands on a target node, or None if it never does.
+
+        Only the start of each pass is visited, so this gives up once that repeats after at most len(self) passes.
+        """
+        for passes in range(len(self) + 1):
+            hits = self.pass_hits(node, targets)
+            if hits.size:
+                return passes * self.pass_length + int(hits[0])
+            node = self.cycle_jump[node]
+        return None
+
+
+def _ghost_cycles(node_map, starts, is_end):
+    """
+    Follow every ghost a pass through the directions at a time until its path starts repeating.
+
+    A ghost's state is (node, position in the directions) so its path must repeat within len(node_map) passes.
+    Only the node at the start of each pass is remembered, a repeat there is the cycle.
+
+    Args:
+        node_map (NodeMap): the compiled network
+        starts (list): starting node ids
+        is_end (np.ndarray): boolean mask over the node ids of the nodes a ghost is trying to reach
+    Returns:
+        list per ghost of (cycle_start, cycle_length, end_steps) where end_steps are the steps <= cycle_start +
+        cycle_length that land on an end node, the ones >= cycle_start recur every cycle_length steps.
+    """
+    cycles = []
+    for node in starts:
+        pass_starts = {}  # node -> step, at the start of each pass through the directions
+        end_steps = []
+        step = 0
+        while node not in pass_starts:
+            pass_starts[node] = step
+            end_steps.extend((node_map.pass_hits(node, is_end) + step).tolist())
+            node = int(node_map.cycle_jump[node])
+            step += node_map.pass_length
+        cycle_start = pass_starts[node]
+        cycles.append((cycle_start, step - cycle_start, end_steps))
+    return cycles
+
+
+def _crt(residue1, modulus1, residue2, modulus2):
+    """
+    Combine x = residue1 (mod modulus1) and x = residue2 (mod modulus2), the moduli needn't be coprime.
+
+    Returns:
+        (residue, lcm of the moduli) or None if the congruences can't both hold.
+    """
+    gcd = math.gcd(modulus1, modulus2)
+    if (residue2 - residue1) % gcd:
+        return None
+    lcm = modulus1 // gcd * modulus2
+    # Solve residue1 + modulus1 * k = residue2 (mod modulus2) for k
+    k = ((residue2 - residue1) // gcd * pow(modulus1 // gcd, -1, modulus2 // gcd)) % (modulus2 // gcd)
+    return (residue1 + modulus1 * k) % lcm, lcm
+
+
+def _first_common_end(cycles):
+    """
+    Return the first step every ghost is on an end node at the same time, or None if that never happens.
+
+    Steps before every ghost is inside its cycle are checked directly, after that each ghost is on an end node
+    on a fixed set of residues of its cycle length, and the residues are combined with CRT (LCM when they're 0).
+    """
+    def is_end_step(cycle, step):
+        cycle_start, cycle_length, end_steps = cycle
+        if step > cycle_start:
+            step = cycle_start + (step - cycle_start - 1) % cycle_length + 1  # back into the first lap of the cycle
+        return step in end_steps
+
+    settled = max(cycle[0] for cycle in cycles)
+    # Before every ghost is inside its cycle, only the first ghost's end steps can be common ones
+    first_cycle_start, first_cycle_length, first_end_steps = cycles[0]
+    early_steps = set(first_end_steps)
+    for step in first_end_steps:
+        if step >= first_cycle_start:
+            early_steps.update(range(step, settled, first_cycle_length))
+    for step in sorted(early_steps):
+        if step < settled and all(is_end_step(cycle, step) for cycle in cycles):
+            return step
+
+    # Combine each ghost's recurring end steps as residues of its cycle length
+    solutions = [(0, 1)]
+    for cycle_start, cycle_length, end_steps in cycles:
+        residues = {step % cycle_length for step in end_steps if step >= cycle_start}
+        solutions = {combined for residue, modulus in solutions for end_residue in residues
+                     if (combined := _crt(residue, modulus, end_residue, cycle_length)) is not None}
+        if not solutions:
+            return None
+    best = None
+    settled = max(settled, 1)
+    for residue, modulus in solutions:
+        step = residue + max(0, -(-(settled - residue) // modulus)) * modulus  # first step >= settled
+        if best is None or step < best:
+            best = step
+    return best
+
+
+def _markov_absorption_steps(node_map, log=_LOG):
+    """
+    Markov Chain take on day8, the expected number of steps a random left/right walk takes to get stuck.
+
+    It doesn't answer either part. A node is absorbing when both of its edges lead back to itself, every other
+    node that is certain to reach one is transient and its expected steps t solve (I - Q) t = 1, where Q is the walk
+    between transient nodes. Q is built sparse from the two edges per node so memory stays linear in the number of
+    edges, and solved directly unless it's big enough that an iterative solve is the cheaper one.
+
+    Args:
+        node_map (NodeMap): the compiled network
+        log (slt.EasyLogger, optional): Logger object
+    Returns:
+        NumPy array by node id of the expected steps, 0 for absorbing nodes and inf for nodes that may never get stuck.
+    """
+    from scipy import sparse  # noqa: PLC0415  only this analysis needs SciPy
+    from scipy.sparse.linalg import bicgstab, spsolve  # noqa: PLC0415
+
+    node_ids = np.arange(len(node_map))
+    absorbing = (node_map.left == node_ids) & (node_map.right == node_ids)
+
+    # Walk the edges backwards to find every node that can reach the sources
+    incoming = [[] for _ in node_ids]
+    for node, (left, right) in enumerate(zip(node_map.left.tolist(), node_map.right.tolist())):
+        incoming[left].append(node)
+        incoming[right].append(node)
+
+    def can_reach(sources):
+        reached = sources.copy()
+        queue = deque(np.flatnonzero(sources).tolist())
+        while queue:
+            for node in incoming[queue.popleft()]:
+                if not reached[node]:
+                    reached[node] = True
+                    queue.append(node)
+        return reached
+
+    # Only nodes that can't wander off to somewhere it never gets stuck are absorbed for sure
+    certain = ~can_reach(~can_reach(absorbing))
+    transient = np.flatnonzero(certain & ~absorbing)
+    row_of = np.full(len(node_map), -1, dtype=np.intp)
+    row_of[transient] = np.arange(len(transient))
+    # Q has a 0.5 for each edge between transient nodes, duplicates (left == right) are summed by the conversion
+    rows = np.concatenate((row_of[transient], row_of[transient]))
+    cols = np.concatenate((row_of[node_map.left[transient]], row_of[node_map.right[transient]]))
+    keep = cols >= 0
+    q_ = sparse.coo_matrix((np.full(keep.sum(), 0.5), (rows[keep], cols[keep])), shape=(len(transient),) * 2)
+    log.debug("%d absorbing, %d transient, %d edges in Q", absorbing.sum(), len(transient), q_.nnz)
+
+    steps = np.full(len(node_map), np.inf)
+    steps[absorbing] = 0
+    if len(transient):
+        i_minus_q = (sparse.identity(len(transient)) - q_).tocsr()
+        ones = np.ones(len(transient))
+        info = -1
+        if len(transient) > _DIRECT_SOLVE_LIMIT:
+            # LU fill-in on a well connected network grows much faster than the edges, Krylov doesn't
+            solution, info = bicgstab(i_minus_q, ones, rtol=1e-12, maxiter=10 * len(transient))
+            log.debug("bicgstab info: %d", info)
+        if info != 0:
+            solution = spsolve(i_minus_q.tocsc(), ones)
+        steps[transient] = np.atleast_1d(solution)
+    return steps
 
 
 def day8(use_example=False, log=_LOG):  # noqa: FBT002
     """
     Haunted Wasteland.
 
-    Part 1 works
-
-    The Markov Chain attempt here doesn't work at all, and I barely understand it anyway.
+    Part 2 walks every ghost until its path repeats and combines their cycles with CRT.
+    Set _MARKOV to log the Markov Chain analysis of a random walk from each start too.
 
     Args:
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -844,14 +1990,10 @@ def day8(use_example=False, log=_LOG):  # noqa: FBT002
     graph_dict = {}
     directions = ""
     blank_line_found = False
-    # Track which row/col in the transition matrix maps to which 'state' aka "AAA"
-    cur_row = 0
-    state_indices = {}
-
-    non_absorbing_states = {}
-    absorbing_states = {}
+    trace = _tracing(log)
     for line in data_tuple:
-        log.debug("line: %s", line)
+        if trace:
+            log.debug("line: %s", line)
         if not line:
             blank_line_found = True
             continue
@@ -868,75 +2010,35 @@ def day8(use_example=False, log=_LOG):  # noqa: FBT002
         left_state = matches[1]
         right_state = matches[2]
         graph_dict[cur_state] = (left_state, right_state)
-        state_indices[cur_state] = cur_row
-        cur_row += 1
-        if left_state == right_state:
-            absorbing_states[cur_state] = (left_state, right_state)
-        else:
-            non_absorbing_states[cur_state] = (left_state, right_state)
 
     # follow the directions until you reach ZZZ
-    d_idx = -1
-    len_directions = len(directions)
-    cur_loc = "AAA"
-    steps = 0
-    while 1:
-        d_idx = (d_idx + 1) % len_directions
-        direction = directions[d_idx]
-        # log.debug("%s = (%s, %s)  Go %s", cur_loc, graph_dict[cur_loc][0], graph_dict[cur_loc][1], direction)
-        cur_loc = graph_dict[cur_loc][0] if direction == "L" else graph_dict[cur_loc][1]
-        steps += 1
-        if cur_loc == "ZZZ":
-            break
-    results.append(steps)
+    node_map = NodeMap(graph_dict, directions)
+    steps = node_map.steps_to(node_map.ids["AAA"], node_map.mask(lambda name: name == "ZZZ"))
+    if steps is not None:
+        results.append(steps)
+    _STOPWATCH.lap("part1")
     log.debug("*" * 79)
 
-    total_states = len(absorbing_states) + len(non_absorbing_states)
-    transition_matrix = np.zeros((total_states, total_states))
-    # fill in the matrix with all the non_absorbing_states and keep track of which row/col is which
-    for state, lr_tuple in non_absorbing_states.items():
-        for new_state in lr_tuple:
-            transition_matrix[state_indices[state]][state_indices[new_state]] += .5
-    for state, lr_tuple in absorbing_states.items():
-        for new_state in lr_tuple:
-            transition_matrix[state_indices[state]][state_indices[new_state]] += .5
-
-    log.debug("")
-    log.debug("Transition Matrix")
-    log.debug(transition_matrix)
-    # Calculate the fundamental matrix N =  (I - Q) ^ -1
-    # Q represents the transitions between the non-absorbing states
-    # R represents the transitions between absorbing states and non-absorbing states
-    q_ = transition_matrix[0:len(non_absorbing_states), 0:len(non_absorbing_states)]
-    log.debug("*********** Q ************")
-    log.debug(q_)
-    r_ = transition_matrix[0:len(non_absorbing_states) , len(non_absorbing_states): total_states]
-    log.debug("*********** R ************")
-    log.debug(r_)
-    # n = np.linalg.inv(np.eye(len(non_absorbing_states)) - q)
-    # log.debug("*********** N ************")
-    # log.debug(n)
-    # nr = np.dot(n, r)
-    # log.debug("*********** NR ************")
-    # log.debug(nr)
-
-    # Initialize N as the identity matrix
-    n_ = np.eye(q_.shape[0])
-    log.debug("*********** N ************")
-    log.debug(n_)
-
-    # Iterate until n converges
-    while True:
-        n_next = np.eye(q_.shape[0]) + np.dot(q_, n_)
-        if np.allclose(n_, n_next):
-            break
-        n_ = n_next
-        log.debug("*********** N ************")
-        log.debug(n_)
-
-    # Calculate the expected number of steps to absorption
-    steps = np.dot(n_, np.sum(r_, axis=1))
-    # results.append(steps)
+    # Part 2, every node ending in A at once until they're all on nodes ending in Z
+    starts = [node_map.ids[name] for name in node_map.names if name.endswith("A")]
+    cycles = _ghost_cycles(node_map, starts, node_map.mask(lambda name: name.endswith("Z")))
+    for start, cycle in zip(starts, cycles):
+        log.debug("%s cycle starts at step %d, length %d, end steps %s", node_map.names[start], *cycle)
+    steps = _first_common_end(cycles)
+    if steps is not None:
+        results.append(steps)
+    _STOPWATCH.lap("part2")
+
+    if _MARKOV:
+        # Not part of either answer, how long a random left/right walk from each start takes to get stuck
+        try:
+            expected_steps = _markov_absorption_steps(node_map, log)
+        except ImportError:
+            log.warning("Skipping the Markov Chain analysis, it needs SciPy")
+        else:
+            for start in starts:
+                log.debug("%s expected steps to absorption: %s", node_map.names[start], expected_steps[start])
+        _STOPWATCH.lap("markov")
 
     return display_results(day=day, results=results, log=log)
 
@@ -949,7 +2051,7 @@ def day9(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -968,7 +2070,7 @@ def day10(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -987,7 +2089,7 @@ def day11(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1006,7 +2108,7 @@ def day12(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1025,7 +2127,7 @@ def day13(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1044,7 +2146,7 @@ def day14(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1063,7 +2165,7 @@ def day15(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1082,7 +2184,7 @@ def day16(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1101,7 +2203,7 @@ def day17(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1120,7 +2222,7 @@ def day18(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1139,7 +2241,7 @@ def day19(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1158,7 +2260,7 @@ def day20(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1177,7 +2279,7 @@ def day21(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1196,7 +2298,7 @@ def day22(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1215,7 +2317,7 @@ def day23(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1234,7 +2336,7 @@ def day24(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1253,7 +2355,7 @@ def day25(use_example=False, log=_LOG):  # noqa: FBT002
         use_example (bool): Use the example data set
         log (slt.EasyLogger, optional): Logger object
     Returns:
-        integer number of results
+        DayResult with the answers, timings and status
     """
     day = di = int(log.findCaller()[2][3:])
     if use_example:
@@ -1264,16 +2366,98 @@ def day25(use_example=False, log=_LOG):  # noqa: FBT002
     return display_results(day=day, results=results, log=log)
 
 
-def go(day, use_example=False, log=_LOG):  # noqa: FBT002
+def _summarize_samples(samples):
+    """Return the min/median/p95 (nearest rank) of a list of seconds, in seconds."""
+    ordered = sorted(samples)
+    return {"min": ordered[0],
+            "median": statistics.median(ordered),
+            "p95": ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)]}
+
+
+def benchmark_day(day, use_example=False, runs=5, warmup=1, log=_LOG):  # noqa: FBT002
+    """
+    Time a day's solution over several runs after warming up.
+
+    Each run's time is split into input loading and each part's compute time by the solver's stopwatch laps.
+    The in-process input memo is cleared before every measured run so input loading is read and parsed from
+    the cache shard each time instead of being a dict lookup.
+    Peak memory is measured with tracemalloc on one extra run so the tracing doesn't skew the timings.
+
+    Args:
+        day (int): The day of December
+        use_example (bool, optional): Use example data instead of the web data. Defaults to False.
+        runs (int, optional): Number of timed runs. Defaults to 5.
+        warmup (int, optional): Number of untimed runs first, fills the input cache shard. Defaults to 1.
+        log (slt.EasyLogger, optional): Logger object. Defaults to _LOG.
+
+    Returns:
+        dictionary of {"day", "runs", "warmup", "status", "answers", "input_size",
+        "timings": {label: {"min", "median", "p95"}}, "peak_memory"}
+        with times in seconds and peak memory in bytes.
+    """
+    solver = getattr(sys.modules.get(__name__), f"day{day}")
+    for _ in range(warmup):
+        solver(use_example=use_example, log=log)
+
+    samples = {}
+    day_result = None
+    for _ in range(runs):
+        _INPUT_MEMO.clear()
+        _STOPWATCH.reset()
+        start_time = time.perf_counter()
+        day_result = solver(use_example=use_example, log=log)
+        total_time = time.perf_counter() - start_time
+        for label, seconds in day_result.timings.items():
+            samples.setdefault(label, []).append(seconds)
+        samples.setdefault("total", []).append(total_time)
+
+    _INPUT_MEMO.clear()
+    tracemalloc.start()
+    try:
+        solver(use_example=use_example, log=log)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"day": day, "runs": runs, "warmup": warmup,
+            "status": day_result.status, "answers": day_result.answers, "input_size": day_result.input_size,
+            "timings": {label: _summarize_samples(values) for label, values in samples.items()},
+            "peak_memory": peak_memory}
+
+
+def _show_benchmark(stats, log=_LOG):
+    """Log a benchmark_day result as a small table in milliseconds."""
+    log.result("Day %d benchmark (%d runs after %d warm-up):", stats["day"], stats["runs"], stats["warmup"])
+    for label, summary in stats["timings"].items():
+        log.result("  %-8s min %10.3f ms   median %10.3f ms   p95 %10.3f ms",
+                   label, summary["min"] * 1000, summary["median"] * 1000, summary["p95"] * 1000)
+    log.result("  peak memory %.1f KiB", stats["peak_memory"] / 1024)
+
+
+def _write_benchmark_json(file_name, day_stats):
+    """Write benchmark results with enough context to diff one run against another."""
+    report = {"year": _YEAR,
+              "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+              "python": platform.python_version(),
+              "platform": platform.platform(),
+              "days": day_stats}
+    with open(file_name, "w") as json_file:  # noqa: PTH123
+        json.dump(report, json_file, indent=2)
+
+
+def go(day, use_example=False, log=_LOG, benchmark=0, warmup=1, json_file=None):  # noqa: FBT002
     """Runs the given day's solution to the puzzle.
 
     Args:
         day (int): The day of December
         use_example (bool, optional): Use example data instead of the web data. Defaults to False.
         log (slt.EasyLogger, optional): Logger object. Defaults to _LOG.
+        benchmark (int, optional): Number of timed runs, 0 just solves the puzzle once. Defaults to 0.
+        warmup (int, optional): Number of untimed runs before benchmarking. Defaults to 1.
+        json_file (str, optional): Where to write the benchmark results as JSON. Defaults to None.
 
     Returns:
-        _type_: _description_
+        The day's DayResult, or the benchmark_day statistics when benchmarking.
     """
     if not isinstance(log, slt.EasyLogger):
         err_str = f"log={log} invalid.  Must be an slt.EasyLogger not {type(log)}"
@@ -1286,30 +2470,109 @@ def go(day, use_example=False, log=_LOG):  # noqa: FBT002
     if not isinstance(day, int) and not min_day <= day <= max_day:
         err_str = f"day={day} invalid.  Must be {min_day}-{max_day}"
         raise ValueError(err_str)
+    if benchmark:
+        stats = benchmark_day(day, use_example=use_example, runs=benchmark, warmup=warmup, log=log)
+        _show_benchmark(stats, log=log)
+        if json_file:
+            _write_benchmark_json(json_file, [stats])
+        return stats
+    _STOPWATCH.reset()
     return getattr(sys.modules.get(__name__), f"day{day}")(use_example=use_example, log=log)
 
 
-def run_all(use_example=False, log=_LOG):  # noqa: FBT002
-    """Run the solution for each day's puzzle."""
+def _solve_day(day, use_example, log=_LOG):
+    """
+    Solve a single day, turning an exception into a Broken DayResult.
+
+    Returns:
+        DayResult
+    """
+    _STOPWATCH.reset()
+    try:
+        return getattr(sys.modules.get(__name__), f"day{day}")(use_example=use_example, log=log)
+    except Exception:
+        return DayResult(day, [], status="Broken", error=traceback.format_exc())
+
+
+def _run_day_worker(day, use_example):
+    """
+    Process pool entry point for run_all, solve a single day without logging anything but errors.
+
+    Exceptions become a Broken DayResult here so one broken day can't take down the pool.
+
+    Returns:
+        DayResult
+    """
+    _LOG.setConsoleLevel("ERROR")  # The parent shows the results in day order
+    return _solve_day(day, use_example)
+
+
+def run_all(use_example=False, log=_LOG, workers=1, benchmark=0, warmup=1, json_file=None):  # noqa: FBT002
+    """
+    Run the solution for each day's puzzle.
+
+    Args:
+        use_example (bool, optional): Use example data instead of the web data. Defaults to False.
+        log (slt.EasyLogger, optional): Logger object. Defaults to _LOG.
+        workers (int, optional): Number of processes to solve the days in.  Results are still shown in day order.
+            Defaults to 1 which solves each day serially in this process.
+        benchmark (int, optional): Number of timed runs of each day, 0 just solves each puzzle once.
+            Benchmarks always run serially in this process so the days don't compete for the CPU. Defaults to 0.
+        warmup (int, optional): Number of untimed runs of each day before benchmarking. Defaults to 1.
+        json_file (str, optional): Where to write the benchmark results as JSON. Defaults to None.
+
+    Returns:
+        list of each day's DayResult, or of each day's benchmark_day statistics when benchmarking.
+    """
     if not isinstance(log, slt.EasyLogger):
         err_str = f"log={log} invalid.  Must be an slt.EasyLogger not {type(log)}"
         raise TypeError(err_str)
     if not isinstance(use_example, bool):
         log.error("use_example=%s invalid.  Must be a bool", use_example)
-        return
-    day_dict = {"Completed": [], "Unfinished": [], "Broken": []}
-    for day in range(1, 26, 1):
+        return None
+    if not use_example:
         try:
-            log.result(slt.FG.icyan("Day%d Start" % day))
-            ret_code = getattr(sys.modules.get(__name__), f"day{day}")(use_example=use_example, log=log)
-            if ret_code == 2:
-                day_dict["Completed"].append(day)
-            else:
-                day_dict["Unfinished"].append(day)
+            prefetch_inputs(log=log)
         except Exception:
-            log.exception("Day%d threw Exception", day)
-            day_dict["Broken"].append(day)
-        log.result("*" * 79)
+            log.exception("Prefetch failed, each day will pull its own data")
+    day_dict = {"Completed": [], "Unfinished": [], "Broken": []}
+    day_results = []
+    if benchmark:
+        for day in range(1, 26, 1):
+            try:
+                log.result(slt.FG.icyan("Day%d Start" % day))
+                stats = benchmark_day(day, use_example=use_example, runs=benchmark, warmup=warmup, log=log)
+                _show_benchmark(stats, log=log)
+                day_results.append(stats)
+                day_dict[stats["status"]].append(day)
+            except Exception:
+                log.exception("Day%d threw Exception", day)
+                day_dict["Broken"].append(day)
+            log.result("*" * 79)
+        if json_file:
+            _write_benchmark_json(json_file, day_results)
+    elif workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_day_worker, day, use_example) for day in range(1, 26, 1)]
+            for day, future in enumerate(futures, start=1):
+                log.result(slt.FG.icyan("Day%d Start" % day))
+                try:
+                    day_result = future.result()
+                except Exception:  # The worker process itself died
+                    day_result = DayResult(day, [], status="Broken", error=traceback.format_exc())
+                day_result.show(log=log)
+                day_results.append(day_result)
+                day_dict[day_result.status].append(day)
+                log.result("*" * 79)
+    else:
+        for day in range(1, 26, 1):
+            log.result(slt.FG.icyan("Day%d Start" % day))
+            day_result = _solve_day(day, use_example, log=log)
+            if day_result.status == "Broken":
+                day_result.show(log=log)
+            day_results.append(day_result)
+            day_dict[day_result.status].append(day)
+            log.result("*" * 79)
 
     for day_key, day_list in day_dict.items():
         output_str = "{0:{fill}{align}{width}}".format(day_key + " Days:", width=16, align="<", fill=" ")
@@ -1318,6 +2581,7 @@ def run_all(use_example=False, log=_LOG):  # noqa: FBT002
         if day_list:
             output_str = output_str[:-2]
         log.result(output_str)
+    return day_results
 
 # **********************************************************************************************
 # ******************************* A Collection of example classes ******************************